@@ -1,14 +1,17 @@
 """Automated quality assurance script for Ruff and Mypy checks."""
 
-import subprocess
+import asyncio
 import sys
 
 from loguru import logger
 
 
-def run_command(command: list[str], description: str) -> bool:
+async def run_command(command: list[str], description: str) -> bool:
     """Executes a shell command and returns True if successful.
 
+    The tool output is buffered and printed once the command completes, so
+    checks running concurrently do not interleave their logs.
+
     Args:
         command: List of command arguments.
         description: Friendly name of the check.
@@ -18,35 +21,63 @@ def run_command(command: list[str], description: str) -> bool:
     """
     logger.info(f"🚀 Running {description}...")
     try:
-        # We run the command and pipe output to terminal
-        process = subprocess.run(command, check=False)
-        if process.returncode == 0:
-            logger.success(f"✅ {description} passed.")
-            return True
-        else:
-            logger.error(f"❌ {description} failed with exit code {process.returncode}.")
-            return False
+        process = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT
+        )
     except FileNotFoundError:
         logger.error(f"❌ Tool not found. Make sure {command[0]} is installed.")
         return False
 
+    output, _ = await process.communicate()
+    if output:
+        print(output.decode(errors="replace"), end="")
 
-def main() -> None:
-    """Runs the full QA suite: Formatting, Linting, and Type Checking."""
-    logger.info("🧪 Starting Quality Assurance suite...")
+    if process.returncode == 0:
+        logger.success(f"✅ {description} passed.")
+        return True
+    else:
+        logger.error(f"❌ {description} failed with exit code {process.returncode}.")
+        return False
+
+
+async def run_sequence(steps: list[tuple[list[str], str]]) -> bool:
+    """Runs checks one after the other, without stopping on failures.
+
+    Args:
+        steps: Pairs of (command, description) to execute in order.
+
+    Returns:
+        Boolean indicating whether every step succeeded.
+    """
+    results = [await run_command(cmd, desc) for cmd, desc in steps]
+    return all(results)
+
+
+async def run_pipeline() -> bool:
+    """Runs the Ruff chain and Mypy concurrently.
 
-    # Define our pipeline of checks
-    qa_pipeline = [
+    Ruff format and Ruff check both rewrite files, so they stay sequential;
+    Mypy only reads sources and overlaps with them.
+
+    Returns:
+        Boolean indicating whether every check succeeded.
+    """
+    ruff_steps = [
         (["ruff", "format", "."], "Ruff Formatter"),
         (["ruff", "check", ".", "--fix"], "Ruff Linter (with auto-fix)"),
-        (["mypy", "."], "Mypy Type Checking"),
     ]
+    mypy_steps = [(["mypy", "."], "Mypy Type Checking")]
+
+    # We don't stop immediately so we can see all errors at once
+    results = await asyncio.gather(run_sequence(ruff_steps), run_sequence(mypy_steps))
+    return all(results)
+
+
+def main() -> None:
+    """Runs the full QA suite: Formatting, Linting, and Type Checking."""
+    logger.info("🧪 Starting Quality Assurance suite...")
 
-    all_passed = True
-    for cmd, desc in qa_pipeline:
-        if not run_command(cmd, desc):
-            all_passed = False
-            # We don't stop immediately so we can see all errors at once
+    all_passed = asyncio.run(run_pipeline())
 
     if all_passed:
         logger.success("✨ Everything is perfect! Your code is industrial-grade.")
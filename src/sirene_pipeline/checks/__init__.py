@@ -0,0 +1,56 @@
+"""Verification CLI for the Bronze, Silver and Gold layers.
+
+All checks run in one process on one shared DuckDB connection, so the
+interpreter, the configuration and DuckDB are initialized only once:
+
+    uv run python -m sirene_pipeline.checks [bronze|silver|gold|all]
+"""
+
+import sys
+from collections.abc import Callable
+
+import duckdb
+
+from sirene_pipeline.checks.bronze import verify_bronze_data
+from sirene_pipeline.checks.gold import check_gold_outputs
+from sirene_pipeline.checks.silver import check_silver_data, check_silver_layer
+from sirene_pipeline.utils.duckdb_helpers import get_duck_conn
+
+__all__ = [
+    "check_gold_outputs",
+    "check_silver_data",
+    "check_silver_layer",
+    "main",
+    "verify_bronze_data",
+]
+
+CHECKS: dict[str, list[Callable[[duckdb.DuckDBPyConnection], None]]] = {
+    "bronze": [verify_bronze_data],
+    "silver": [check_silver_data, check_silver_layer],
+    "gold": [check_gold_outputs],
+}
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Runs the requested layer checks on a single shared DuckDB connection.
+
+    Args:
+        argv: Layers to check ('bronze', 'silver', 'gold' or 'all').
+            Defaults to the command line arguments, or 'all' if none are given.
+    """
+    layers = (sys.argv[1:] if argv is None else argv) or ["all"]
+    if "all" in layers:
+        layers = list(CHECKS)
+
+    unknown = [layer for layer in layers if layer not in CHECKS]
+    if unknown:
+        print(f"❌ Unknown layer(s): {', '.join(unknown)}. Expected: {', '.join(CHECKS)} or all.")
+        sys.exit(2)
+
+    con = get_duck_conn()
+    try:
+        for layer in layers:
+            for check in CHECKS[layer]:
+                check(con)
+    finally:
+        con.close()
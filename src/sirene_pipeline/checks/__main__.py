@@ -0,0 +1,6 @@
+"""Entry point for `python -m sirene_pipeline.checks`."""
+
+from sirene_pipeline.checks import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Bronze layer checks: availability and content of the raw Parquet exports."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import duckdb
+import pyarrow.parquet as pq
+
+from sirene_pipeline.config import CONFIG
+from sirene_pipeline.utils.duckdb_helpers import register_parquet_view
+
+
+def _verify_file(con: duckdb.DuckDBPyConnection, parquet_file: Path) -> str:
+    """Builds the verification report of a single Bronze Parquet file.
+
+    Args:
+        con: DuckDB cursor dedicated to this file.
+        parquet_file: Path to the Bronze Parquet file.
+
+    Returns:
+        The formatted report, printed by the caller to keep files from interleaving.
+    """
+    lines = [f"\n{'=' * 60}", f"🥉 BRONZE: {parquet_file.name}", f"{'=' * 60}"]
+
+    if not parquet_file.exists():
+        lines.append(f"❌ Missing file: {parquet_file}")
+        return "\n".join(lines)
+
+    # 1. Row count & 2. Schema: read from the Parquet footer, no scan needed
+    parquet_meta = pq.ParquetFile(parquet_file)
+    schema = parquet_meta.schema_arrow
+    lines.append(f"📈 Total Rows: {parquet_meta.metadata.num_rows:,}")
+
+    lines.append("\n--- Schema & Types ---")
+    width = max((len(name) for name in schema.names), default=0)
+    lines.extend(f"{field.name:<{width}}  {field.type}" for field in schema)
+
+    # 3. Preview, rendered by DuckDB itself
+    register_parquet_view(con, parquet_file.absolute())
+    lines.append("\n--- Preview ---")
+    lines.append(str(con.sql("SELECT * FROM v LIMIT 5")))
+
+    return "\n".join(lines)
+
+
+def verify_bronze_data(con: duckdb.DuckDBPyConnection) -> None:
+    """Verifies that the Bronze export of every configured dataset is readable.
+
+    Files are verified concurrently, each worker on its own cursor of the
+    shared connection; reports are printed in dataset order once collected.
+
+    Args:
+        con: DuckDB connection shared by every verified file.
+    """
+    bronze_dir = Path(CONFIG.bronze_dir)
+
+    if not bronze_dir.exists():
+        print(f"❌ Error: Bronze directory not found at {bronze_dir}")
+        return
+
+    parquet_files = [bronze_dir / dataset.filename for dataset in CONFIG.datasets.values()]
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        reports = executor.map(lambda path: _verify_file(con.cursor(), path), parquet_files)
+        for report in reports:
+            print(report)
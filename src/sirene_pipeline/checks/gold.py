@@ -0,0 +1,113 @@
+"""Gold layer checks: availability, content and join integrity of the outputs."""
+
+from pathlib import Path
+from typing import Any
+
+import duckdb
+from loguru import logger
+
+from sirene_pipeline.config import CONFIG
+from sirene_pipeline.utils.duckdb_helpers import register_parquet_view
+
+
+def check_gold_outputs(con: duckdb.DuckDBPyConnection) -> None:
+    """Reads and summarizes Gold Parquet files.
+
+    This function verifies data quality, availability, and join integrity
+    between establishments and legal units.
+
+    Args:
+        con: DuckDB connection reused for every Gold file.
+    """
+    # Resolve Gold output directory from project settings
+    gold_dir: Path = Path(CONFIG.gold.output_dir)
+
+    if not gold_dir.exists():
+        logger.error(f"❌ Gold directory not found: {gold_dir}")
+        return
+
+    logger.info("🔍 Starting Gold layer verification...")
+    print("-" * 50)
+
+    files_to_check: list[str] = [
+        CONFIG.gold.master_filename,
+        CONFIG.gold.kpis.dept_dist,
+        CONFIG.gold.kpis.sectors,
+        CONFIG.gold.kpis.size_dist,
+    ]
+
+    # Register every available file once, then run all checks against the views
+    views: dict[str, str] = {}
+    for filename in files_to_check:
+        file_path: Path = gold_dir / filename
+
+        if not file_path.exists():
+            logger.warning(f"⚠️ Missing file: {filename}")
+            continue
+
+        views[filename] = file_path.stem
+        register_parquet_view(con, file_path, views[filename])
+
+    # Row counts of every file in a single multi-file scan (one plan, one pass)
+    paths: dict[str, str] = {(gold_dir / filename).as_posix(): filename for filename in views}
+    counts: dict[str, Any] = {}
+    if paths:
+        try:
+            rows: list[tuple[Any, ...]] = con.execute(
+                """
+                SELECT filename, COUNT(*)
+                FROM read_parquet(?, filename = true, union_by_name = true)
+                GROUP BY filename
+                """,
+                [list(paths)],
+            ).fetchall()
+            counts = {paths[path]: total for path, total in rows}
+        except Exception as e:
+            logger.error(f"❌ Failed to fetch row counts: {e}")
+
+    for filename, view in views.items():
+        try:
+            # Files without any row do not appear in the grouped counts
+            stats: Any = counts.get(filename, 0)
+            logger.success(f"✅ {filename}: {stats:,} rows found.")
+
+            # Previews are rendered by DuckDB itself, without a pandas round-trip
+            preview: duckdb.DuckDBPyRelation
+            if "master" in filename:
+                preview = con.sql(
+                    f"""
+                    SELECT siret, denominationUniteLegale, departement, age_entreprise
+                    FROM {view}
+                    LIMIT 3
+                    """
+                )
+            else:
+                preview = con.sql(f"SELECT * FROM {view} LIMIT 3")
+
+            print(f"\nPreview for {filename}:")
+            preview.show()
+            print("-" * 50)
+
+        except Exception as e:
+            logger.error(f"❌ Error reading {filename}: {e}")
+
+    # Join integrity check: the master is written in 100k-row groups, so DuckDB
+    # prunes every group whose footer reports no NULLs on the Legal Unit columns
+    master_view: str | None = views.get(CONFIG.gold.master_filename)
+    if master_view is not None:
+        res_integrity: tuple[Any, ...] | None = con.execute(
+            f"""
+            SELECT COUNT(*)
+            FROM {master_view}
+            WHERE denominationUniteLegale IS NULL AND nomUniteLegale IS NULL
+            """
+        ).fetchone()
+
+        if res_integrity is not None:
+            null_count: Any = res_integrity[0]
+            if null_count > 0:
+                logger.warning(f"❗ Alert: {null_count:,} records with no match.")
+            else:
+                logger.success("✨ Join integrity check passed.")
+
+    logger.info("🏁 Verification complete.")
@@ -0,0 +1,220 @@
+"""Silver layer checks: data profiling, regional filtering and engineered columns."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import duckdb
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from loguru import logger
+
+from sirene_pipeline.config import CONFIG
+from sirene_pipeline.utils.duckdb_helpers import register_parquet_view
+
+# Columns profiled in the Data Quality section (those absent from a file are skipped)
+COLUMNS_OF_INTEREST = [
+    "siret",
+    "siren",
+    "codePostalEtablissement",
+    "departement",
+    "secteur_activite",
+    "categorieEntreprise",
+    "dateCreationEtablissement",
+    "dateCreationUniteLegale",
+    "age_entreprise",
+    "ingested_at",
+]
+
+
+def _profile_dataset(con: duckdb.DuckDBPyConnection, dataset_dir: Path) -> str:
+    """Builds the profiling report of a single partitioned Silver dataset.
+
+    Args:
+        con: DuckDB cursor dedicated to this dataset.
+        dataset_dir: Directory of the Silver dataset.
+
+    Returns:
+        The formatted report, printed by the caller to keep datasets from interleaving.
+    """
+    register_parquet_view(con, dataset_dir.absolute())
+
+    lines = [f"\n{'=' * 60}", f"📊 PROFILING: {dataset_dir.name}", f"{'=' * 60}"]
+
+    # 1. Row count & 2. Schema: read from the Parquet footers, no scan needed
+    dataset = ds.dataset(dataset_dir, format="parquet", partitioning="hive")
+    schema = dataset.schema
+    lines.append(f"📈 Total Rows: {dataset.count_rows():,}")
+
+    lines.append("\n--- Schema & Types ---")
+    width = max((len(name) for name in schema.names), default=0)
+    lines.extend(f"{field.name:<{width}}  {field.type}" for field in schema)
+
+    # 3. Data Statistics: one scan aggregating only the columns of interest
+    # (SUMMARIZE would compute every statistic for every column)
+    profiled = [col for col in COLUMNS_OF_INTEREST if col in schema.names]
+    if profiled:
+        column_stats = ", ".join(
+            f"""{{
+                'column_name': '{col}',
+                'null_percentage': round(100.0 * avg(({col} IS NULL)::INTEGER), 2),
+                'approx_unique': approx_count_distinct({col}),
+                'min': min({col})::VARCHAR,
+                'max': max({col})::VARCHAR
+            }}"""
+            for col in profiled
+        )
+        # Rendered by DuckDB's own box printer: no pandas conversion of the result
+        stats = con.sql(f"""
+            SELECT unnest(stats, recursive := true)
+            FROM (SELECT [{column_stats}] AS stats FROM v)
+        """)
+        lines.append("\n--- Data Quality (Nulls & Uniqueness) ---")
+        lines.append(str(stats))
+
+    # 4. Regional Check (Specific for etablissements)
+    if "etablissements" in dataset_dir.name:
+        # We extract the first 2 digits of the postal code to verify filtering
+        distrib = con.sql("""
+            SELECT
+                substring(codePostalEtablissement, 1, 2) AS dept,
+                count(*) AS count,
+                round(count(*) * 100.0 / sum(count(*)) OVER (), 2) AS percentage
+            FROM v
+            GROUP BY dept
+            ORDER BY dept
+        """)
+        lines.append("\n--- 📍 Regional Distribution (IDF Check) ---")
+        lines.append(str(distrib))
+
+    return "\n".join(lines)
+
+
+def check_silver_data(con: duckdb.DuckDBPyConnection) -> None:
+    """Profiles Silver datasets and verifies regional filters.
+
+    Files are profiled concurrently, each worker on its own cursor of the
+    shared connection; reports are printed in dataset order once collected.
+
+    Args:
+        con: DuckDB connection shared by every profiled dataset.
+    """
+    # Paths come from the frozen configuration snapshot
+    silver_dir = Path(CONFIG.silver.output_dir)
+
+    if not silver_dir.exists():
+        print(f"❌ Error: Silver directory not found at {silver_dir}")
+        return
+
+    datasets = sorted(path for path in silver_dir.glob("*_silver") if path.is_dir())
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        reports = executor.map(lambda path: _profile_dataset(con.cursor(), path), datasets)
+        for report in reports:
+            print(report)
+
+
+def _top_values(path: Path, column: str, k: int) -> dict[str, int]:
+    """Returns the k most frequent non-null values of a low-cardinality column.
+
+    The column is read as an Arrow dictionary, so values are counted on their
+    int32 indices and only the k winners are looked up as strings.
+
+    Args:
+        path: Path to the Parquet file or partitioned dataset directory.
+        column: Name of the column to count.
+        k: Number of values to return.
+
+    Returns:
+        Mapping of value to number of rows, most frequent first.
+    """
+    table = pq.read_table(path, columns=[column], read_dictionary=[column])
+    encoded = table.unify_dictionaries().column(column).combine_chunks()
+
+    value_counts = pc.value_counts(encoded.indices.drop_null())
+    counts = value_counts.field("counts")
+    # Sort key names are ignored when selecting on a plain array
+    top = pc.select_k_unstable(counts, k, [("counts", "descending")])
+
+    values = encoded.dictionary.take(value_counts.field("values").take(top))
+    return dict(zip(values.to_pylist(), counts.take(top).to_pylist(), strict=True))
+
+
+def check_silver_layer(con: duckdb.DuckDBPyConnection) -> None:
+    """Analyzes Silver files to verify incremental loads and feature engineering.
+
+    Args:
+        con: DuckDB connection reused for every analyzed file.
+    """
+    silver_dir = Path(CONFIG.silver.output_dir)
+
+    if not silver_dir.exists():
+        logger.error(f"❌ Silver directory not found at {silver_dir}")
+        return
+
+    silver_files = sorted(path for path in silver_dir.glob("*_silver") if path.is_dir())
+
+    if not silver_files:
+        logger.warning("⚠️ No Silver datasets found in Silver directory.")
+        return
+
+    for file_path in silver_files:
+        logger.info(f"🔍 Analyzing: {file_path.name}")
+        register_parquet_view(con, file_path)
+
+        # Column presence comes from the Parquet schema, no data is loaded
+        columns = {row[0] for row in con.execute("DESCRIBE v").fetchall()}
+
+        new_cols = ["activity_sector", "company_age", "ingested_at"]
+
+        # Only check department for establishments
+        if "etablissements" in file_path.name:
+            new_cols.append("department")
+
+        present = [col for col in new_cols if col in columns]
+
+        # Single projected scan: only the checked columns are decoded
+        aggregates = ["count(*) AS total_rows"]
+        # count(col) only reads the validity mask: no per-row boolean is materialized
+        aggregates += [
+            f"100 - count({col}) * 100.0 / nullif(count(*), 0) AS null_{col}" for col in present
+        ]
+        if "ingested_at" in columns:
+            aggregates += [
+                "max(ingested_at) AS last_load",
+                "min(ingested_at) AS first_load",
+                "count(DISTINCT ingested_at) AS load_count",
+            ]
+        if "company_age" in columns:
+            aggregates.append("avg(company_age) FILTER (WHERE company_age > 0) AS avg_age")
+
+        cursor = con.execute(f"SELECT {', '.join(aggregates)} FROM v")
+        row = cursor.fetchone() or ()
+        stats = dict(zip([desc[0] for desc in cursor.description], row))
+
+        # 1. Basic Stats
+        logger.info(f"📊 Total records: {stats.get('total_rows', 0):,}")
+
+        # 2. Check New Engineered Columns
+        for col in new_cols:
+            if col in columns:
+                null_pct = stats[f"null_{col}"] or 0.0
+                logger.success(f"✅ Column '{col}' present (Nulls: {null_pct:.2f}%)")
+            else:
+                logger.error(f"❌ Column '{col}' is MISSING")
+
+        # 3. Incremental Insight
+        if "ingested_at" in columns:
+            logger.info(f"⏱️ Data spans from {stats['first_load']} to {stats['last_load']}")
+            logger.info(f"🔄 Number of distinct ingestion batches: {stats['load_count']}")
+
+        # 4. Business Logic Preview
+        if "company_age" in columns and stats["avg_age"] is not None:
+            logger.info(f"🏢 Average company age: {stats['avg_age']:.1f} years")
+
+        if "department" in columns:
+            top_depts = _top_values(file_path, "department", k=3)
+            logger.info(f"📍 Top 3 departments: {top_depts}")
+
+        print("-" * 50)
@@ -1,5 +1,6 @@
 """Configuration management module using Dynaconf."""
 
+from dataclasses import dataclass
 from pathlib import Path
 
 from dynaconf import Dynaconf
@@ -13,3 +14,86 @@ settings = Dynaconf(
     environments=True,
     load_dotenv=True,
 )
+
+
+@dataclass(frozen=True, slots=True)
+class _Kpis:
+    """Filenames of the Gold KPI outputs."""
+
+    dept_dist: str
+    sectors: str
+    size_dist: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Gold:
+    """Gold layer locations."""
+
+    output_dir: str
+    master_filename: str
+    kpis: _Kpis
+
+
+@dataclass(frozen=True, slots=True)
+class _Silver:
+    """Silver layer locations."""
+
+    output_dir: str
+    registry_db: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Dataset:
+    """Source definition of a SIRENE dataset."""
+
+    url: str
+    filename: str
+
+
+@dataclass(frozen=True, slots=True)
+class _Config:
+    """Read-only snapshot of the settings used by the check scripts."""
+
+    bronze_dir: str
+    bronze_registry: str
+    silver: _Silver
+    gold: _Gold
+    datasets: dict[str, _Dataset]
+
+
+def _freeze(source: Dynaconf) -> _Config:
+    """Resolves the Dynaconf settings once into plain slotted dataclasses.
+
+    Attribute access on the snapshot is a regular slot lookup instead of a
+    walk through Dynaconf's lazy proxies and environment lookups.
+
+    Args:
+        source: Loaded Dynaconf settings.
+
+    Returns:
+        The frozen configuration snapshot.
+    """
+    return _Config(
+        bronze_dir=source.bronze_dir,
+        bronze_registry=source.bronze_registry,
+        silver=_Silver(
+            output_dir=source.silver.output_dir,
+            registry_db=source.silver.registry_db,
+        ),
+        gold=_Gold(
+            output_dir=source.gold.output_dir,
+            master_filename=source.gold.master_filename,
+            kpis=_Kpis(
+                dept_dist=source.gold.kpis.dept_dist,
+                sectors=source.gold.kpis.sectors,
+                size_dist=source.gold.kpis.size_dist,
+            ),
+        ),
+        datasets={
+            name: _Dataset(url=dataset.url, filename=dataset.filename)
+            for name, dataset in source.datasets.items()
+        },
+    )
+
+
+CONFIG = _freeze(settings)
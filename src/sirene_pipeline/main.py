@@ -3,12 +3,14 @@
 import time
 from pathlib import Path
 
+import duckdb
 from loguru import logger
 
 from sirene_pipeline.config import settings
 from sirene_pipeline.services.bronze_job import run_ingestion_bronze
 from sirene_pipeline.services.gold_job import run_gold_layer
 from sirene_pipeline.services.silver_job import run_silver_transformation
+from sirene_pipeline.utils.duckdb_helpers import get_duck_conn
 
 
 def main() -> None:
@@ -26,6 +28,40 @@ def main() -> None:
     limit = settings.get("sample_limit", 0)
     datasets_to_process = list(settings.datasets.keys())
 
+    # Shared DuckDB session: one setup (threads, extensions, caches) for every job.
+    # The Bronze registry is attached as 'bronze' and used as the default catalog.
+    registry_path = Path(settings.bronze_registry)
+    registry_path.parent.mkdir(parents=True, exist_ok=True)
+    con = get_duck_conn()
+    remote_sources = any(
+        str(settings.datasets[name].url).startswith("http") for name in datasets_to_process
+    )
+    if remote_sources and (not settings.download.staging or limit > 0):
+        # Remote sources are read directly over HTTP when staging is disabled and on
+        # sampled runs (never staged): reuse HTTP connections and retry transient failures
+        con.execute("INSTALL httpfs; LOAD httpfs")
+        con.execute("SET http_keep_alive = true")
+        con.execute(f"SET http_retries = {settings.duckdb.http_retries}")
+    con.execute(f"ATTACH '{registry_path.as_posix()}' AS bronze")
+    con.execute("USE bronze")
+
+    try:
+        _run_layers(con, limit, datasets_to_process)
+    finally:
+        con.close()
+
+    total_duration = time.time() - start_time
+    logger.success(f"✅ SIRENE Pipeline execution finished in {total_duration:.2f}s.")
+
+
+def _run_layers(con: duckdb.DuckDBPyConnection, limit: int, datasets_to_process: list[str]) -> None:
+    """Runs the Bronze, Silver and Gold phases on a shared DuckDB connection.
+
+    Args:
+        con: Shared connection, with the Bronze registry as default catalog.
+        limit: Row limit applied to Bronze ingestion (0 for a full load).
+        datasets_to_process: Names of the datasets declared in settings.
+    """
     # 2. BRONZE LAYER: Ingestion
     # We collect successful ingestions to know what can be processed in Silver
     logger.info("--- Phase 1: Bronze Ingestion ---")
@@ -38,7 +74,12 @@ def main() -> None:
         try:
             logger.info(f"Processing Bronze for: {name}")
             run_ingestion_bronze(
-                url=config.url, output_path=target_path, limit=limit, dataset_name=name
+                url=config.url,
+                output_path=target_path,
+                limit=limit,
+                dataset_name=name,
+                columns=list(settings.silver[name].selected_columns),
+                con=con,
             )
             successful_bronze.append(name)
         except Exception as e:
@@ -52,7 +93,7 @@ def main() -> None:
     for name in successful_bronze:
         try:
             logger.info(f"Processing Silver for: {name}")
-            run_silver_transformation(name)
+            run_silver_transformation(name, con=con)
             successful_silver.append(name)
         except Exception as e:
             logger.error(f"❌ Silver transformation failed for {name}: {e}")
@@ -65,7 +106,7 @@ def main() -> None:
     if len(successful_silver) == len(datasets_to_process):
         try:
             logger.info("Processing Gold layer (Master table + KPIs)")
-            run_gold_layer()
+            run_gold_layer(con=con)
             logger.success("🏆 Gold layer completed successfully.")
         except Exception as e:
             logger.error(f"❌ Gold layer failed: {e}")
@@ -75,9 +116,6 @@ def main() -> None:
             f"Successful: {successful_silver}"
         )
 
-    total_duration = time.time() - start_time
-    logger.success(f"✅ SIRENE Pipeline execution finished in {total_duration:.2f}s.")
-
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,6 @@
 """Module for incremental and idempotent ingestion of SIRENE data."""
 
+import re
 import time
 from datetime import datetime
 from pathlib import Path
@@ -10,6 +11,11 @@ from tqdm import tqdm
 
 # Assuming Dynaconf is used to load settings.toml
 from sirene_pipeline.config import settings
+from sirene_pipeline.utils.download_helpers import stage_remote_file
+from sirene_pipeline.utils.duckdb_helpers import get_duck_conn
+
+# Table and column names are interpolated in SQL, values are bound as parameters
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 
 def run_ingestion_bronze(
@@ -18,6 +24,8 @@ def run_ingestion_bronze(
     limit: int = 0,
     dataset_name: str = "Dataset",
     registry_path: str = "",
+    columns: list[str] | None = None,
+    con: duckdb.DuckDBPyConnection | None = None,
 ) -> None:
     """Ingests SIRENE data incrementally using settings.toml.
 
@@ -27,13 +35,26 @@ def run_ingestion_bronze(
         limit: Optional override for the row limit.
         dataset_name: Name of the dataset (used for table naming).
         registry_path: Optional path for the DuckDB registry
+        columns: Optional subset of source columns to ingest (all columns if empty).
+        con: Optional shared connection whose default catalog is the Bronze registry.
+            When omitted, a connection to the registry is opened and closed here.
+
+    Raises:
+        ValueError: If the dataset name or a column name is not a plain SQL identifier.
     """
     logger.info(f"{dataset_name}: Starting incremental Bronze ingestion")
+
+    for identifier in [dataset_name, *(columns or [])]:
+        if not _IDENTIFIER.match(identifier):
+            raise ValueError(f"Invalid SQL identifier for Bronze ingestion: {identifier!r}")
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # 1. Database Connection using config path
-    db_metadata_path = registry_path if len(registry_path) > 0 else settings.bronze_registry
-    con = duckdb.connect(database=db_metadata_path)
+    # 1. Database Connection using config path (unless the caller shares one)
+    owns_connection = con is None
+    if con is None:
+        db_metadata_path = registry_path if len(registry_path) > 0 else settings.bronze_registry
+        con = get_duck_conn(db_metadata_path)
 
     # 2. Prepare Audit Metadata & Parameters
     ingested_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -42,27 +63,74 @@ def run_ingestion_bronze(
     #        2. Else use 'sample_limit' from settings.toml
     #        3. Default to 0 (Full load) if nothing found
     final_limit = limit if limit is not None else settings.get("sample_limit", 0)
-    limit_clause = f"LIMIT {final_limit}" if final_limit > 0 else ""
+
+    # Remote sources are downloaded once (parallel range requests) and scanned
+    # locally: DuckDB then reads row groups from disk instead of over HTTP.
+    # A sampled run only reads the first row groups, which DuckDB fetches by range.
+    if final_limit == 0 and url.startswith(("http://", "https://")) and settings.download.staging:
+        url = stage_remote_file(
+            url,
+            Path(settings.bronze_dir) / "_staging",
+            max_workers=settings.download.max_workers,
+            chunk_size=settings.download.chunk_mb * 1024 * 1024,
+        ).as_posix()
+
+    source_params: dict[str, object] = {"url": url}
+    limit_clause = ""
+    if final_limit > 0:
+        limit_clause = "LIMIT $limit"
+        source_params["limit"] = final_limit
+    row_params = {**source_params, "ingested_at": ingested_at}
 
     # Identify Primary Key (siren or siret)
     pk = "siret" if "etablissement" in dataset_name.lower() else "siren"
 
-    # 3. SQL Logic: Anti-Join for Idempotency
-    #
-    query = f"""
-        -- Create table structure if it doesn't exist
-        CREATE TABLE IF NOT EXISTS {dataset_name} AS 
-        SELECT *, '{ingested_at}' AS ingested_at FROM read_parquet('{url}') WHERE 1=0;
-
-        -- Incremental Insert: Only rows where PK is not already in the table
-        INSERT INTO {dataset_name}
-        SELECT source.*, '{ingested_at}' as ingested_at
-        FROM read_parquet('{url}') AS source
-        LEFT JOIN {dataset_name} AS target ON source.{pk} = target.{pk}
-        WHERE target.{pk} IS NULL
-        {limit_clause};
-
-        COPY {dataset_name} TO '{output_path}' (FORMAT PARQUET, OVERWRITE_OR_IGNORE);
+    # Projection & LIMIT are pushed into the scan so only the needed column chunks
+    # and the first row groups are fetched from the remote file
+    projection = "*"
+    if columns:
+        selected = [col for col in columns if col != "ingested_at"]
+        if pk not in selected:
+            selected.insert(0, pk)
+        projection = ", ".join(selected)
+    source = f"(SELECT {projection} FROM read_parquet($url) {limit_clause})"
+
+    # 3. SQL Logic: Unique Index for Idempotency
+    # The ART index on the PK lets DuckDB reject known keys on insert instead of
+    # building a hash join over the whole registry table on every run.
+    # Statements are kept separate so each can bind its own parameters and the
+    # query text stays identical across runs of a dataset (plan reuse).
+    create_query = f"""
+        CREATE TABLE IF NOT EXISTS {dataset_name} AS
+        SELECT *, $ingested_at::VARCHAR AS ingested_at FROM {source} WHERE 1=0
+    """
+
+    # Also covers registries created before the index existed
+    index_query = (
+        f"CREATE UNIQUE INDEX IF NOT EXISTS {dataset_name}_{pk}_idx ON {dataset_name} ({pk})"
+    )
+
+    # Row totals per table, maintained on insert instead of re-counting
+    stats_table_query = """
+        CREATE TABLE IF NOT EXISTS _bronze_stats (
+            table_name VARCHAR PRIMARY KEY,
+            row_count BIGINT
+        )
+    """
+
+    # Incremental Insert: rows whose PK is already in the table are ignored
+    insert_query = f"""
+        INSERT OR IGNORE INTO {dataset_name} BY NAME
+        SELECT source.*, $ingested_at::VARCHAR AS ingested_at
+        FROM {source} AS source
+    """
+
+    # The registry (native DuckDB storage) is the source of truth read by Silver;
+    # the Parquet export is only rewritten when its content actually changed.
+    # Large ZSTD row groups keep the export compact and cheap to scan in parallel.
+    export_query = f"""
+        COPY {dataset_name} TO $output_path
+        (FORMAT PARQUET, COMPRESSION 'zstd', ROW_GROUP_SIZE 1000000, OVERWRITE_OR_IGNORE)
     """
 
     start_time = time.time()
@@ -75,15 +143,59 @@ def run_ingestion_bronze(
         leave=False,
     ) as pbar:
         try:
-            con.execute(query)
+            con.execute(create_query, row_params)
+            # The registry only stores the projected columns: columns selected since it
+            # was created are added, NULL for the rows already ingested
+            existing_columns = {
+                row[0] for row in con.execute(f"DESCRIBE {dataset_name}").fetchall()
+            }
+            for name, column_type, *_ in con.execute(
+                f"DESCRIBE SELECT * FROM {source}", source_params
+            ).fetchall():
+                if name not in existing_columns:
+                    logger.warning(f"[{dataset_name}] Adding column {name} ({column_type})")
+                    con.execute(f"ALTER TABLE {dataset_name} ADD COLUMN {name} {column_type}")
+            con.execute(index_query)
+            con.execute(stats_table_query)
+
+            # One-off count for registries that predate the stats table
+            known = con.execute(
+                "SELECT 1 FROM _bronze_stats WHERE table_name = ?", [dataset_name]
+            ).fetchone()
+            if known is None:
+                con.execute(
+                    f"INSERT INTO _bronze_stats SELECT ?, count(*) FROM {dataset_name}",
+                    [dataset_name],
+                )
+
+            # Insert and stats update are committed together
+            con.begin()
+            try:
+                # DuckDB reports the number of inserted rows as the INSERT result
+                inserted_result = con.execute(insert_query, row_params).fetchone()
+                inserted = inserted_result[0] if inserted_result else 0
+                result = con.execute(
+                    """
+                    UPDATE _bronze_stats SET row_count = row_count + ?
+                    WHERE table_name = ?
+                    RETURNING row_count
+                    """,
+                    [inserted, dataset_name],
+                ).fetchone()
+                con.commit()
+            except Exception:
+                con.rollback()
+                raise
+            # handle case where result is None (e.g., if the stats row is missing)
+            row_count = result[0] if result else 0
+
+            if inserted > 0 or not output_path.exists():
+                con.execute(export_query, {"output_path": output_path.as_posix()})
             pbar.update(1)
 
             duration = time.time() - start_time
-            result = con.execute(f"SELECT count(*) FROM {dataset_name}").fetchone()
-            # handle case where result is None (e.g., if table is empty or query fails)
-            row_count = result[0] if result else 0
 
-            if row_count == 0:
+            if inserted == 0:
                 logger.warning(f"{dataset_name} No new rows ingested. Table is up to date.")
 
             logger.success(
@@ -93,4 +205,5 @@ def run_ingestion_bronze(
             logger.error(f"[{dataset_name}] Ingestion failed: {e}")
             raise
         finally:
-            con.close()
+            if owns_connection:
+                con.close()
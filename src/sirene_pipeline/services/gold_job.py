@@ -4,18 +4,90 @@ This module joins Silver datasets to create a unified 'Master' table and
 computes key performance indicators (KPIs) for business analysis.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 
 import duckdb
 from loguru import logger
 
 from sirene_pipeline.config import settings
+from sirene_pipeline.utils.data_helpers import parquet_glob
+from sirene_pipeline.utils.duckdb_helpers import get_duck_conn
 from sirene_pipeline.utils.metrics import monitor_step
 
 
+@dataclass(frozen=True, slots=True)
+class _Kpi:
+    """Aggregation stored as a Gold table and exported to Parquet."""
+
+    # Group column: an incremental run recomputes the groups touched by new rows
+    key: str
+    # Aggregation over the master rows matching {where}
+    query: str
+    order_by: str | None = None
+
+
+KPIS = {
+    # KPI 1: Establishments by Department
+    "dept_dist": _Kpi(
+        key="departement",
+        query="""
+            SELECT departement, COUNT(*) AS total_establishments
+            FROM gold.master
+            WHERE {where}
+            GROUP BY departement
+        """,
+        order_by="total_establishments DESC",
+    ),
+    # KPI 2: Dominant Sectors per Department
+    "sectors": _Kpi(
+        key="departement",
+        query="""
+            WITH secteur_activite AS (
+                SELECT departement, secteur_activite, COUNT(*) AS count
+                FROM gold.master
+                WHERE {where}
+                GROUP BY ALL
+            )
+            SELECT departement, secteur_activite, count
+            FROM secteur_activite
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY departement ORDER BY count DESC) = 1
+        """,
+    ),
+    # KPI 3: Company Size Distribution
+    "size_dist": _Kpi(
+        key="categorieEntreprise",
+        query="""
+            SELECT categorieEntreprise, COUNT(*) AS total
+            FROM gold.master
+            WHERE categorieEntreprise IS NOT NULL AND {where}
+            GROUP BY categorieEntreprise
+        """,
+        order_by="total DESC",
+    ),
+}
+
+
+def _parquet_columns(con: duckdb.DuckDBPyConnection, path: str) -> list[str]:
+    """Returns the column names of a Parquet dataset, read from its footers.
+
+    Args:
+        con: DuckDB connection.
+        path: Parquet file or glob.
+
+    Returns:
+        The dataset column names.
+    """
+    return [
+        row[0] for row in con.execute("DESCRIBE SELECT * FROM read_parquet(?)", [path]).fetchall()
+    ]
+
+
 @monitor_step
 def run_gold_layer(
-    custom_silver_dir: Path | None = None, custom_gold_dir: Path | None = None
+    custom_silver_dir: Path | None = None,
+    custom_gold_dir: Path | None = None,
+    con: duckdb.DuckDBPyConnection | None = None,
 ) -> None:
     """Processes the Gold layer by enriching data and calculating KPIs.
 
@@ -24,9 +96,15 @@ def run_gold_layer(
        create a comprehensive master file.
     2. Aggregation: Computation of three specific KPIs defined in requirements.
 
+    Both are kept as tables of the persistent Gold database: after the first
+    run, only the rows ingested in Silver since the previous run are joined and
+    only the KPI groups they touch are recomputed.
+
     Args:
         custom_silver_dir: Optional override for the input Silver directory (used for tests).
         custom_gold_dir: Optional override for the output Gold directory (used for tests).
+        con: Optional shared connection. When omitted, an in-memory connection is
+            opened and closed here.
 
     Raises:
         FileNotFoundError: If required Silver files are missing.
@@ -41,84 +119,168 @@ def run_gold_layer(
 
     gold_dir.mkdir(parents=True, exist_ok=True)
 
+    # Silver datasets are partitioned directories, read through a glob
+    etab_dir: Path = silver_dir / "etablissements_silver"
+    ul_dir: Path = silver_dir / "unites_legales_silver"
+    etab_path: str = parquet_glob(etab_dir)
+    ul_path: str = parquet_glob(ul_dir)
     # Use .as_posix() for SQL compatibility across all Operating Systems
-    etab_path: str = (silver_dir / "etablissements_silver.parquet").as_posix()
-    ul_path: str = (silver_dir / "unites_legales_silver.parquet").as_posix()
     master_path: str = (gold_dir / settings.gold.master_filename).as_posix()
+    gold_db: str = (gold_dir / settings.gold.database_filename).as_posix()
 
     # Verify input availability
-    if not Path(etab_path).exists() or not Path(ul_path).exists():
+    if not etab_dir.exists() or not ul_dir.exists():
         logger.error(f"❌ Silver files missing in {silver_dir}. Run Silver job first.")
         raise FileNotFoundError("Missing required Silver parquet files.")
 
-    con = duckdb.connect(database=":memory:")
+    owns_connection = con is None
+    if con is None:
+        con = get_duck_conn()
 
     try:
+        # Gold tables live in native DuckDB storage: no Parquet decode between the
+        # master and the KPIs, and the master stays queryable after the run.
+        con.execute(f"ATTACH '{gold_db}' AS gold")
+
         # STEP 1: ENRICHMENT (Denormalization)
         # ---------------------------------------------------------
-        logger.info(f"🔗 Creating enriched Master Table: {settings.gold.master_filename}")
-        con.execute(f"""
-            COPY (
-                SELECT 
-                    e.*,
-                    ul.denominationUniteLegale,
-                    ul.nomUniteLegale,
-                    ul.prenom1UniteLegale,
-                    ul.categorieEntreprise,
-                    ul.categorieJuridiqueUniteLegale,
-                    ul.economieSocialeSolidaireUniteLegale
-                FROM read_parquet('{etab_path}') AS e
-                LEFT JOIN read_parquet('{ul_path}') AS ul ON e.siren = ul.siren
-            ) TO '{master_path}' (FORMAT PARQUET);
-        """)
-
-        # STEP 2: KPI GENERATION (Aggregations)
-        # ---------------------------------------------------------
+        logger.info(f"🔗 Refreshing enriched Master Table: {settings.gold.master_filename}")
+        # Explicit projection: only whitelisted column chunks are decoded from Silver,
+        # and the master schema does not grow when Silver gains columns.
+        # The Silver schemas are read from the Parquet footers.
+        etab_silver_columns = _parquet_columns(con, etab_path)
+        ul_silver_columns = _parquet_columns(con, ul_path)
+        master_columns = [col for col in settings.gold.master_columns if col in etab_silver_columns]
+        master_select = f"""
+            SELECT
+                {", ".join(f"e.{col}" for col in master_columns)},
+                ul.denominationUniteLegale,
+                ul.nomUniteLegale,
+                ul.prenom1UniteLegale,
+                ul.categorieEntreprise,
+                ul.categorieJuridiqueUniteLegale,
+                ul.economieSocialeSolidaireUniteLegale
+            FROM read_parquet($etab_path) AS e
+            LEFT JOIN read_parquet($ul_path) AS ul ON e.siren = ul.siren
+        """
+        paths = {"etab_path": etab_path, "ul_path": ul_path}
+
+        # Silver only ever appends entities, so the master is refreshed from the rows
+        # ingested since the last run. It is rebuilt when it does not exist yet, when
+        # its columns changed, or when Silver carries no ingestion timestamps.
+        gold_tables = {
+            row[0]
+            for row in con.execute(
+                "SELECT table_name FROM information_schema.tables WHERE table_catalog = 'gold'"
+            ).fetchall()
+        }
+        existing_columns = [
+            row[0]
+            for row in con.execute(
+                "SELECT column_name FROM information_schema.columns"
+                " WHERE table_catalog = 'gold' AND table_name = 'master'"
+                " ORDER BY ordinal_position"
+            ).fetchall()
+        ]
+        incremental = (
+            gold_tables.issuperset({"master", "watermark", *KPIS})
+            and existing_columns[: len(master_columns)] == master_columns
+            and "ingested_at" in etab_silver_columns
+            and "ingested_at" in ul_silver_columns
+        )
 
-        # KPI 1: Establishments by Department
-        logger.info(f"📊 Calculating: {settings.gold.kpis.dept_dist}")
-        con.execute(f"""
-            COPY (
-                SELECT 
-                    departement, 
-                    COUNT(*) as total_establishments
-                FROM read_parquet('{master_path}')
-                GROUP BY departement
-                ORDER BY total_establishments DESC
-            ) TO '{(gold_dir / settings.gold.kpis.dept_dist).as_posix()}' (FORMAT PARQUET);
-        """)
-
-        # KPI 2: Dominant Sectors per Department
-        logger.info(f"📊 Calculating: {settings.gold.kpis.sectors}")
-        con.execute(f"""
-            COPY (
-                WITH secteur_activite AS (
-                    SELECT 
-                        departement, 
-                        secteur_activite, 
-                        COUNT(*) as count
-                    FROM read_parquet('{master_path}')
-                    GROUP BY ALL
+        # The master refresh, the KPI refresh and the watermark run in one transaction,
+        # the watermark written last: if any step fails, every table of the Gold
+        # database is left as it was and the next run picks up the same Silver rows
+        # again. The Parquet exports cannot be rolled back: they are only written once
+        # the transaction is committed.
+        con.begin()
+        try:
+            if incremental:
+                # Touched rows: new establishments, and establishments whose Legal Unit
+                # arrived after them (their Legal Unit columns were NULL until now).
+                con.execute(
+                    f"""
+                    CREATE OR REPLACE TEMP TABLE gold_delta AS
+                    {master_select}
+                    WHERE e.ingested_at > (SELECT etab_ingested_at FROM gold.watermark)
+                        OR e.siren IN (
+                            SELECT siren FROM read_parquet($ul_path)
+                            WHERE ingested_at > (SELECT ul_ingested_at FROM gold.watermark)
+                        )
+                """,
+                    paths,
                 )
-                SELECT departement, secteur_activite, count
-                FROM secteur_activite
-                QUALIFY ROW_NUMBER() OVER(PARTITION BY departement ORDER BY count DESC) = 1
-            ) TO '{(gold_dir / settings.gold.kpis.sectors).as_posix()}' (FORMAT PARQUET);
-        """)
-
-        # KPI 3: Company Size Distribution
-        logger.info(f"📊 Calculating: {settings.gold.kpis.size_dist}")
-        con.execute(f"""
-            COPY (
-                SELECT 
-                    categorieEntreprise, 
-                    COUNT(*) as total
-                FROM read_parquet('{master_path}')
-                WHERE categorieEntreprise IS NOT NULL
-                GROUP BY categorieEntreprise
-                ORDER BY total DESC
-            ) TO '{(gold_dir / settings.gold.kpis.size_dist).as_posix()}' (FORMAT PARQUET);
-        """)
+                delta_rows = con.execute("SELECT count(*) FROM gold_delta").fetchone()
+                logger.info(f"📊 Master rows to refresh: {delta_rows[0] if delta_rows else 0:,}")
+                # KPI groups to recompute, before and after the refresh of their rows
+                con.execute("""
+                    CREATE OR REPLACE TEMP TABLE gold_touched AS
+                    SELECT DISTINCT departement, categorieEntreprise FROM gold_delta
+                    UNION
+                    SELECT departement, categorieEntreprise
+                    FROM gold.master SEMI JOIN gold_delta USING (siret)
+                """)
+                con.execute("DELETE FROM gold.master WHERE siret IN (SELECT siret FROM gold_delta)")
+                con.execute("INSERT INTO gold.master BY NAME SELECT * FROM gold_delta")
+            else:
+                logger.info("🧱 Building Master Table from the full Silver layer")
+                con.execute(f"CREATE OR REPLACE TABLE gold.master AS {master_select}", paths)
+
+            # STEP 2: KPI GENERATION (Aggregations)
+            # ---------------------------------------------------------
+            # KPI tables live in the Gold database; an incremental run only recomputes
+            # the groups (departments, company sizes) touched by the refreshed rows.
+            # All KPI statements are sent to DuckDB as one script.
+            statements = []
+            # Small row groups keep per-group null counts fine-grained, so filters on the
+            # joined Legal Unit columns (e.g. the join integrity check) can skip whole
+            # groups from the footer statistics alone.
+            exports = [
+                f"COPY gold.master TO '{master_path}' (FORMAT PARQUET, ROW_GROUP_SIZE 100000)"
+            ]
+            for name, kpi in KPIS.items():
+                filename = getattr(settings.gold.kpis, name)
+                logger.info(f"📊 Calculating: {filename}")
+                if incremental:
+                    # coalesce: a NULL group is refreshed like any other
+                    touched = (
+                        f"coalesce({kpi.key}, '')"
+                        f" IN (SELECT coalesce({kpi.key}, '') FROM gold_touched)"
+                    )
+                    statements.append(f"DELETE FROM gold.{name} WHERE {touched}")
+                    statements.append(f"INSERT INTO gold.{name} {kpi.query.format(where=touched)}")
+                else:
+                    statements.append(
+                        f"CREATE OR REPLACE TABLE gold.{name} AS {kpi.query.format(where='true')}"
+                    )
+                order_by = f"ORDER BY {kpi.order_by}" if kpi.order_by else ""
+                exports.append(f"""
+                    COPY (SELECT * FROM gold.{name} {order_by})
+                    TO '{(gold_dir / filename).as_posix()}' (FORMAT PARQUET)
+                """)
+            con.execute(";\n".join(statements))
+
+            if "ingested_at" in etab_silver_columns and "ingested_at" in ul_silver_columns:
+                con.execute(
+                    """
+                    CREATE OR REPLACE TABLE gold.watermark AS
+                    SELECT
+                        (SELECT max(ingested_at) FROM read_parquet($etab_path)) AS etab_ingested_at,
+                        (SELECT max(ingested_at) FROM read_parquet($ul_path)) AS ul_ingested_at
+                """,
+                    paths,
+                )
+            con.commit()
+        except Exception:
+            # The transaction is open here: rolling back keeps the original error and
+            # leaves a shared connection usable by the caller
+            con.rollback()
+            raise
+
+        # Parquet exports, kept for file-based consumers (checks, notebooks). Every run
+        # rewrites them all, so a failed export is repaired by the next run.
+        con.execute(";\n".join(exports))
 
         logger.success(f"🏁 Gold layer finished. Files saved in: {gold_dir}")
 
@@ -126,4 +288,9 @@ def run_gold_layer(
         logger.error(f"❌ Gold layer failed: {e}")
         raise
     finally:
-        con.close()
+        if owns_connection:
+            con.close()
+        else:
+            con.execute("DROP TABLE IF EXISTS gold_delta")
+            con.execute("DROP TABLE IF EXISTS gold_touched")
+            con.execute("DETACH DATABASE IF EXISTS gold")
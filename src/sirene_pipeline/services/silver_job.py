@@ -1,19 +1,189 @@
 """Module for cleaning and validating SIRENE data from Bronze to Silver layer."""
 
-from datetime import datetime
+import os
+import shutil
 from pathlib import Path
 
 import duckdb
 import pandas as pd
 from loguru import logger
-from pandera.errors import SchemaError
+from pandera.errors import SchemaError, SchemaErrors
+from pandera.pandas import DataFrameModel
 
 from sirene_pipeline.config import settings
-from sirene_pipeline.utils.data_helpers import get_last_ingested_date
+from sirene_pipeline.utils.data_helpers import get_last_ingested_date, parquet_glob
+from sirene_pipeline.utils.duckdb_helpers import get_duck_conn
 from sirene_pipeline.utils.silver_schemas import SCHEMA_MAP
 
+# Business rules: Default values
+FILL_RULES = {
+    "etatAdministratifEtablissement": "A",
+    "trancheEffectifsEtablissement": "00",
+    "enseigne1Etablissement": "Non renseigné",
+    "economieSocialeSolidaireUniteLegale": "N",
+}
+# Default for any other missing text value
+MISSING_TEXT = "Indéterminé"
+# Silver Parquet layout: ZSTD level 3 compresses the repetitive SIRENE strings far
+# better than snappy at a similar decode cost, and row groups match DuckDB's
+# 122,880-row scan unit. String columns are dictionary-encoded by the writer.
+SILVER_PARQUET_OPTIONS = (
+    "FORMAT PARQUET, COMPRESSION 'zstd', COMPRESSION_LEVEL 3, ROW_GROUP_SIZE 122880"
+)
+
+
+def _silver_types(schema: type[DataFrameModel]) -> dict[str, str]:
+    """Maps each column of a Silver schema to the DuckDB type it is stored with.
+
+    The validation does not rewrite the data, so the Silver files must already
+    carry the types the schema coerces to.
 
-def run_silver_transformation(dataset_name: str) -> None:
+    Args:
+        schema: Pandera model of the Silver dataset.
+
+    Returns:
+        DuckDB type of each schema column.
+    """
+    types = {}
+    for name, column in schema.to_schema().columns.items():
+        dtype = column.dtype.type
+        if pd.api.types.is_bool_dtype(dtype):
+            types[name] = "BOOLEAN"
+        elif pd.api.types.is_float_dtype(dtype):
+            types[name] = "DOUBLE"
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            types[name] = "TIMESTAMP_NS"
+        else:
+            types[name] = "VARCHAR"
+    return types
+
+
+def _clean_columns(
+    columns: list[str],
+    column_types: dict[str, str],
+    silver_types: dict[str, str],
+    date_creation_field: str,
+    id_cols: list[str],
+) -> list[str]:
+    """Builds the SQL select list applying the Silver cleaning rules and features.
+
+    Args:
+        columns: Bronze columns kept in Silver.
+        column_types: DuckDB type of each Bronze column.
+        silver_types: DuckDB type of each Silver column, cast to when it differs.
+        date_creation_field: Creation date column, used for the company age.
+        id_cols: Identifier columns, left untouched so missing IDs can be dropped.
+
+    Returns:
+        SQL expressions, each aliased to its Silver column name.
+    """
+    expressions = []
+    # Cleaned creation date, also the input of the company age
+    creation_date = ""
+    for col in columns:
+        silver_type = silver_types.get(col, column_types[col])
+        value = col if column_types[col] == silver_type else f"CAST({col} AS {silver_type})"
+        if "date" in col.lower() or col == "ingested_at":
+            # Nanosecond timestamps; unparsable values become NULL
+            expr = f"TRY_CAST({col} AS TIMESTAMP_NS)"
+            if col == date_creation_field:
+                # Years < 1678 or > 2261 set to NULL (bounds of ns timestamps in pandas)
+                expr = (
+                    f"CASE WHEN {expr} BETWEEN TIMESTAMP '1678-01-01' AND TIMESTAMP '2261-12-31'"
+                    f" THEN {expr} END"
+                )
+                creation_date = expr
+        elif col == "codePostalEtablissement":
+            expr = f"trim({value})"
+        elif col in FILL_RULES:
+            expr = f"coalesce({value}, '{FILL_RULES[col]}')"
+        elif silver_type == "VARCHAR" and col not in id_cols:
+            expr = f"coalesce({value}, '{MISSING_TEXT}')"
+        else:
+            expr = value
+        expressions.append(f"{expr} AS {col}")
+
+    # --- FEATURE ENGINEERING ---
+    if "codePostalEtablissement" in columns:
+        expressions.append("left(trim(codePostalEtablissement), 2) AS departement")
+
+    naf_col = (
+        "activitePrincipaleEtablissement" if "siret" in columns else "activitePrincipaleUniteLegale"
+    )
+    if naf_col in columns:
+        expressions.append(f"coalesce(left({naf_col}, 2), '{MISSING_TEXT}') AS secteur_activite")
+
+    if creation_date:
+        # Unparsable or out-of-range dates are NULL there, hence an age of -1
+        expressions.append(
+            f"coalesce(CAST(year(current_date) - year({creation_date}) AS DOUBLE), -1.0)"
+            " AS age_entreprise"
+        )
+
+    return expressions
+
+
+def _recover_silver(silver_output: Path) -> None:
+    """Cleans up after a compaction interrupted by a crash.
+
+    The swap is two renames: when the dataset directory is missing, the crash
+    happened between them and the previous dataset is restored. Otherwise the
+    leftover directories are only removed.
+
+    Args:
+        silver_output: Directory of the partitioned Silver dataset.
+    """
+    compacted = silver_output.with_name(f"{silver_output.name}.compacted")
+    previous = silver_output.with_name(f"{silver_output.name}.previous")
+    if previous.exists() and not silver_output.exists():
+        logger.warning(f"♻️ Restoring {silver_output.name} after an interrupted compaction")
+        os.replace(previous, silver_output)
+    shutil.rmtree(previous, ignore_errors=True)
+    shutil.rmtree(compacted, ignore_errors=True)
+
+
+def _compact_silver(
+    con: duckdb.DuckDBPyConnection, silver_output: Path, id_cols: list[str], sort_cols: list[str]
+) -> None:
+    """Rewrites a partitioned Silver dataset into one file per partition.
+
+    The latest version of each entity is kept. The dataset is rebuilt next to
+    the current one then swapped in, so readers never see a partial dataset.
+
+    Args:
+        con: DuckDB connection used for the rewrite.
+        silver_output: Directory of the partitioned Silver dataset.
+        id_cols: Identifier columns of the dataset.
+        sort_cols: Columns the rows are ordered by within each file.
+    """
+    logger.info(f"🗜️ Compacting Silver storage: {silver_output.name}")
+    compacted = silver_output.with_name(f"{silver_output.name}.compacted")
+    previous = silver_output.with_name(f"{silver_output.name}.previous")
+    _recover_silver(silver_output)
+
+    con.execute(
+        f"""
+        COPY (
+            SELECT * FROM read_parquet($source, hive_partitioning = true)
+            QUALIFY row_number() OVER (
+                PARTITION BY {", ".join(id_cols)} ORDER BY ingested_at DESC
+            ) = 1
+            ORDER BY {", ".join(sort_cols)}
+        )
+        TO '{compacted.as_posix()}'
+        ({SILVER_PARQUET_OPTIONS}, PARTITION_BY (ingested_date))
+    """,
+        {"source": parquet_glob(silver_output)},
+    )
+
+    os.replace(silver_output, previous)
+    os.replace(compacted, silver_output)
+    shutil.rmtree(previous)
+
+
+def run_silver_transformation(
+    dataset_name: str, con: duckdb.DuckDBPyConnection | None = None
+) -> None:
     """Performs incremental transformation, regional filtering, and cleaning.
 
     This function reads new Bronze data, applies business rules, handles
@@ -22,11 +192,13 @@ def run_silver_transformation(dataset_name: str) -> None:
     Args:
         dataset_name: Name of the dataset to process ('etablissements' or
             'unites_legales').
+        con: Optional shared connection with the Bronze registry attached as
+            'bronze'. When omitted, a dedicated connection is opened and closed here.
 
     Raises:
         ValueError: If dataset_name is missing from SCHEMA_MAP.
         KeyError: If configuration settings are missing.
-        SchemaError: If final data fails Pandera validation.
+        SchemaErrors: If the new rows fail Pandera validation.
     """
     logger.info(f"🚀 Starting Incremental Silver transformation for: {dataset_name}")
 
@@ -38,12 +210,13 @@ def run_silver_transformation(dataset_name: str) -> None:
 
     try:
         # Configuration setup
-        bronze_file = settings.datasets[dataset_name].filename
-        bronze_path = Path(settings.bronze_dir) / bronze_file
+        # Bronze is read from its DuckDB registry (native storage, no Parquet decode)
+        bronze_registry = Path(settings.bronze_registry)
         silver_config = settings.silver.get(dataset_name)
         silver_dir = Path(settings.silver.output_dir)
         silver_dir.mkdir(parents=True, exist_ok=True)
-        silver_output = silver_dir / f"{dataset_name}_silver.parquet"
+        # Hive-partitioned dataset directory (one partition per ingestion date)
+        silver_output = silver_dir / f"{dataset_name}_silver"
 
         target_depts = settings.filters.get("idf_departments", [])
         selected_columns = silver_config.get("selected_columns")
@@ -58,142 +231,159 @@ def run_silver_transformation(dataset_name: str) -> None:
         logger.error(f"❌ Configuration error for {dataset_name}: {e}")
         raise
 
+    # A crash during a previous compaction must not hide the dataset from the watermark
+    _recover_silver(silver_output)
+
     # 1. Incremental Check (Watermark)
     last_date = get_last_ingested_date(silver_output)
     logger.info(f"🔍 Checking for new data since: {last_date}")
 
-    # 2. Extraction & Filtering via DuckDB
-    con = duckdb.connect()
-    try:
-        where_clauses = [f"ingested_at > '{last_date}'"]
-        if dataset_name == "etablissements" and target_depts:
-            depts_str = ", ".join([f"'{d}'" for d in target_depts])
-            where_clauses.append(f"substring(codePostalEtablissement, 1, 2) IN ({depts_str})")
-
-        # Determine the date field to protect against Pandas 'Out of Bounds'
-        date_creation_field = (
-            "dateCreationEtablissement"
-            if dataset_name == "etablissements"
-            else "dateCreationUniteLegale"
-        )
-
-        # Build SQL with date cleaning (Years < 1678 or > 2261 set to NULL)
-        sql_columns = []
-        for col in selected_columns:
-            if col == date_creation_field:
-                sql_columns.append(f"""
-                    CASE 
-                        WHEN {col} < '1678-01-01' THEN NULL 
-                        WHEN {col} > '2261-12-31' THEN NULL
-                        ELSE {col} 
-                    END AS {col}
-                """)
-            else:
-                sql_columns.append(col)
-
-        query = f"""
-            SELECT {", ".join(sql_columns)} 
-            FROM read_parquet('{bronze_path}')
-            WHERE {" AND ".join(where_clauses)}
-        """
-        new_df = con.execute(query).df()
-        logger.info(f"📊 New rows extracted: {len(new_df):,}")
-
-    except Exception as e:
-        logger.error(f"❌ Extraction failed for {dataset_name}: {e}")
-        raise
-    finally:
-        con.close()
-
-    if new_df.empty:
-        logger.success(f"✅ No new data to process for {dataset_name}.")
-        return
-
-    # 3. Data Cleaning & Feature Engineering
-    logger.info("🧹 Cleaning and enriching new data")
-
-    # Drop missing critical IDs
-    id_cols = ["siret", "siren"] if "siret" in new_df.columns else ["siren"]
-    new_df = new_df.dropna(subset=id_cols)
-
-    # --- FIX: Robust Postal Code Cleaning (Fixes Pandera crashes) ---
-    if "codePostalEtablissement" in new_df.columns:
-        # Trim whitespace and filter for exact 5-digit format
-        new_df["codePostalEtablissement"] = (
-            new_df["codePostalEtablissement"].astype(str).str.strip()
-        )
-        valid_cp_mask = new_df["codePostalEtablissement"].str.match(r"^\d{5}$", na=False)
-        invalid_count = (~valid_cp_mask).sum()
+    # Determine the date field to protect against Pandas 'Out of Bounds'
+    date_creation_field = (
+        "dateCreationEtablissement"
+        if dataset_name == "etablissements"
+        else "dateCreationUniteLegale"
+    )
+    id_cols = ["siret", "siren"] if "siret" in selected_columns else ["siren"]
+
+    # Rows kept in Silver: known identifiers and, for establishments, a 5-digit postal code
+    known_ids = " AND ".join(f"{col} IS NOT NULL" for col in id_cols)
+    keep_conditions = [known_ids]
+    valid_postal_code = r"coalesce(regexp_full_match(codePostalEtablissement, '\d{5}'), false)"
+    if "codePostalEtablissement" in selected_columns:
+        keep_conditions.append(valid_postal_code)
+    keep_rows = " AND ".join(keep_conditions)
+
+    # Rows are written sorted so the row-group min/max statistics let Gold skip
+    # groups: by department then SIREN for establishments (KPI filters, join key),
+    # by SIREN for legal units (join key of the master table). Partitioned writes
+    # flush per-partition buffers, so the order is clustered rather than strict,
+    # which is all the row-group statistics need.
+    sort_cols = (
+        ["departement", "siren"] if "codePostalEtablissement" in selected_columns else ["siren"]
+    )
 
+    owns_connection = con is None
+    if con is None:
+        con = get_duck_conn()
+    try:
+        if owns_connection:
+            con.execute(f"ATTACH '{bronze_registry.as_posix()}' AS bronze (READ_ONLY)")
+
+        try:
+            # 2. Extraction, Cleaning & Feature Engineering in one DuckDB query:
+            # string, date and arithmetic rules run vectorized, without a pandas copy
+            # Filter values are bound as parameters: the query text only depends on
+            # the dataset, and the department list is matched as a list value.
+            # ingested_at is stored as text in Bronze, compared in its own format.
+            where_clauses = ["ingested_at > $last_date"]
+            params: dict[str, object] = {"last_date": str(last_date)}
+            if dataset_name == "etablissements" and target_depts:
+                where_clauses.append(
+                    "substring(codePostalEtablissement, 1, 2) = ANY ($departments)"
+                )
+                params["departments"] = list(target_depts)
+
+            column_types = dict(
+                con.execute(
+                    "SELECT column_name, data_type FROM information_schema.columns"
+                    " WHERE table_catalog = 'bronze' AND table_name = ?",
+                    [dataset_name],
+                ).fetchall()
+            )
+            select_list = _clean_columns(
+                selected_columns, column_types, _silver_types(schema), date_creation_field, id_cols
+            )
+
+            logger.info("🧹 Cleaning and enriching new data")
+            con.execute(
+                f"""
+                CREATE OR REPLACE TEMP TABLE silver_delta AS
+                SELECT {", ".join(select_list)}
+                FROM bronze.{dataset_name}
+                WHERE {" AND ".join(where_clauses)}
+            """,
+                params,
+            )
+
+            counts = con.execute(f"""
+                SELECT
+                    count(*),
+                    count(*) FILTER (WHERE {known_ids} AND NOT ({keep_rows}))
+                FROM silver_delta
+            """).fetchone()
+            extracted, invalid_count = counts if counts else (0, 0)
+        except Exception as e:
+            logger.error(f"❌ Extraction failed for {dataset_name}: {e}")
+            raise
+
+        logger.info(f"📊 New rows extracted: {extracted:,}")
+
+        if extracted == 0:
+            logger.success(f"✅ No new data to process for {dataset_name}.")
+            return
+
+        # Drop missing critical IDs and malformed postal codes
         if invalid_count > 0:
             logger.warning(f"🗑️ Dropped {invalid_count} malformed postal codes (noise in SIRENE)")
-            new_df = new_df[valid_cp_mask].copy()
-
-    # --- DATE CASTING & PRECISION ---
-    date_cols = [c for c in new_df.columns if "date" in c.lower() or "ingested_at" in c]
-    for col in date_cols:
-        new_df[col] = pd.to_datetime(new_df[col], errors="coerce")
-        if not new_df[col].isna().all():
-            new_df[col] = new_df[col].dt.as_unit("ns")
-
-    # Business rules: Default values
-    fill_rules = {
-        "etatAdministratifEtablissement": "A",
-        "trancheEffectifsEtablissement": "00",
-        "enseigne1Etablissement": "Non renseigné",
-        "economieSocialeSolidaireUniteLegale": "N",
-    }
-    for col, value in fill_rules.items():
-        if col in new_df.columns:
-            new_df[col] = new_df[col].fillna(value)
-
-    # --- FEATURE ENGINEERING ---
-    if "codePostalEtablissement" in new_df.columns:
-        new_df["departement"] = new_df["codePostalEtablissement"].str[:2]
-
-    naf_col = (
-        "activitePrincipaleEtablissement"
-        if "siret" in new_df.columns
-        else "activitePrincipaleUniteLegale"
-    )
-    if naf_col in new_df.columns:
-        new_df["secteur_activite"] = new_df[naf_col].str[:2]
-
-    if date_creation_field in new_df.columns:
-        current_year = datetime.now().year
-        new_df["age_entreprise"] = current_year - new_df[date_creation_field].dt.year
-        new_df["age_entreprise"] = new_df["age_entreprise"].fillna(-1.0)
-
-    # Final string fill
-    string_cols = new_df.select_dtypes(include=["object"]).columns
-    new_df[string_cols] = new_df[string_cols].fillna("Indéterminé")
-
-    # 4. Merge with Existing Silver Data
-    if silver_output.exists():
-        logger.info("🔄 Merging with existing Silver storage")
-        existing_df = pd.read_parquet(silver_output)
-        final_df = pd.concat([existing_df, new_df])
-
-        # Ensure overall data quality for postal codes after merge
-        if "codePostalEtablissement" in final_df.columns:
-            final_df = final_df[final_df["codePostalEtablissement"].str.match(r"^\d{5}$", na=False)]
-
-        final_df = final_df.drop_duplicates(subset=id_cols, keep="last")
-    else:
-        final_df = new_df
-
-    # 5. Data Quality Validation
-    logger.info(f"🛡️ Validating combined {dataset_name} data")
-    try:
-        validated_df = schema.validate(final_df)
-    except SchemaError as e:
-        logger.error(f"🚨 Schema validation failed: {e}")
-        raise
+        con.execute(f"DELETE FROM silver_delta WHERE NOT ({keep_rows})")
+
+        # 3. Data Quality Validation
+        # Existing Silver rows were validated when written: only new rows are checked
+        # The delta is handed over as Arrow: strings stay in Arrow buffers instead of
+        # being materialized as Python objects by the DuckDB to pandas conversion.
+        logger.info(f"🛡️ Validating new {dataset_name} data")
+        new_df = con.table("silver_delta").to_arrow_table().to_pandas(types_mapper=pd.ArrowDtype)
+        # The rows were cleaned and filtered in SQL, so large deltas are validated on a
+        # random sample (see 'validation_sample'); all failures are reported at once.
+        sample_size = settings.get("validation_sample", 0)
+        sample = sample_size if 0 < sample_size < len(new_df) else None
+        try:
+            schema.validate(new_df, sample=sample, random_state=0, lazy=True)
+        except (SchemaError, SchemaErrors) as e:
+            logger.error(f"🚨 Schema validation failed: {e}")
+            raise
+
+        # 4. Append to the Silver Layer
+        # Each run only writes its own rows, as new files under the partition of
+        # its ingestion date: the existing Silver files are never rewritten.
+        # Entities already in Silver (e.g. after a Bronze registry rebuild) are
+        # skipped by an anti-join that only scans the existing identifier columns.
+        new_rows = "silver_delta"
+        append_params: dict[str, object] = {}
+        if any(silver_output.rglob("*.parquet")):
+            ids = ", ".join(id_cols)
+            new_rows = f"""(
+                SELECT * FROM silver_delta
+                ANTI JOIN (SELECT {ids} FROM read_parquet($existing)) AS existing USING ({ids})
+            )"""
+            append_params["existing"] = parquet_glob(silver_output)
+        try:
+            appended = con.execute(
+                f"""
+                COPY (
+                    SELECT *, CAST(ingested_at AS DATE) AS ingested_date FROM {new_rows}
+                    ORDER BY {", ".join(sort_cols)}
+                )
+                TO '{silver_output.as_posix()}'
+                ({SILVER_PARQUET_OPTIONS}, PARTITION_BY (ingested_date), APPEND)
+            """,
+                append_params,
+            ).fetchone()
+            # COPY reports the number of rows written
+            added = appended[0] if appended else 0
+            logger.success(f"🏁 Transformation finished: {added} new rows added.")
+        except Exception as e:
+            logger.error(f"❌ Failed to save Silver file: {e}")
+            raise
+
+        # 5. Compaction, once appends have left too many small files
+        file_count = sum(1 for _ in silver_output.rglob("*.parquet"))
+        if file_count > settings.silver.compaction_file_threshold:
+            _compact_silver(con, silver_output, id_cols, sort_cols)
 
-    # 6. Save to Silver Layer
-    try:
-        validated_df.to_parquet(silver_output, index=False, compression="snappy")
-        logger.success(f"🏁 Transformation finished: {len(new_df)} new rows added.")
-    except Exception as e:
-        logger.error(f"❌ Failed to save Silver file: {e}")
-        raise
+    finally:
+        if owns_connection:
+            con.close()
+        else:
+            con.execute("DROP TABLE IF EXISTS silver_delta")
@@ -3,38 +3,70 @@
 from datetime import datetime
 from pathlib import Path
 
-import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+
+def parquet_glob(dataset_dir: Path) -> str:
+    """Returns the glob matching every Parquet file of a (partitioned) dataset.
+
+    Args:
+        dataset_dir: Root directory of the dataset.
+
+    Returns:
+        The glob pattern, usable in DuckDB's read_parquet.
+    """
+    return f"{dataset_dir.as_posix()}/**/*.parquet"
+
+
+def _max_ingested_at(parquet_file: Path) -> datetime | None:
+    """Reads the maximum ingested_at of a Parquet file from its footer statistics.
+
+    Args:
+        parquet_file: Path to the Parquet file.
+
+    Returns:
+        The maximum value, or None if the file holds no dated rows.
+    """
+    metadata = pq.read_metadata(parquet_file)
+    column = metadata.schema.names.index("ingested_at")
+
+    maxima = []
+    for index in range(metadata.num_row_groups):
+        row_group = metadata.row_group(index)
+        statistics = row_group.column(column).statistics
+        if statistics is not None and statistics.has_min_max:
+            maxima.append(statistics.max)
+        elif row_group.num_rows > 0:
+            # No statistics written: fall back to reading this file's column
+            table = pq.read_table(parquet_file, columns=["ingested_at"])
+            return pc.max(table.column("ingested_at")).as_py()  # type: ignore[no-any-return]
+
+    return max(maxima, default=None)
 
 
 def get_last_ingested_date(silver_path: Path) -> datetime:
-    """Finds the maximum ingested_at date in the existing Silver file.
+    """Finds the maximum ingested_at date in the existing Silver dataset.
 
-    This function uses DuckDB to efficiently query the metadata of the
-    Parquet file without loading the entire dataset into memory.
+    The value comes from the min/max statistics stored in the Parquet footers:
+    only the metadata of each row group is read, no column data is decoded.
 
     Args:
-        silver_path: Path to the Silver parquet file.
+        silver_path: Directory of the partitioned Silver dataset.
 
     Returns:
         The maximum datetime found in the 'ingested_at' column,
-        or a default old date if the file does not exist.
+        or a default old date if the dataset does not exist.
     """
+    default_date = datetime(1900, 1, 1)
     if not silver_path.exists():
-        return datetime(1900, 1, 1)
+        return default_date
 
-    con = duckdb.connect()
     try:
-        # We query the max date directly from the parquet file
-        result = con.execute(
-            f"SELECT MAX(ingested_at) FROM read_parquet('{silver_path}')"
-        ).fetchone()
-
-        last_date = result[0] if result else None
-
+        maxima = [_max_ingested_at(path) for path in silver_path.rglob("*.parquet")]
         # Ensure we return a datetime object, not None
-        return last_date if last_date else datetime(1900, 1, 1)
-    except Exception:
-        # In case the column doesn't exist yet or file is corrupted
-        return datetime(1900, 1, 1)
-    finally:
-        con.close()
+        return max((value for value in maxima if value is not None), default=default_date)
+    except (OSError, ValueError, pa.ArrowException):
+        # In case the column doesn't exist yet or a file is corrupted
+        return default_date
@@ -0,0 +1,51 @@
+"""Utility functions shared by the DuckDB-based jobs and checks."""
+
+import os
+from pathlib import Path
+
+import duckdb
+
+from sirene_pipeline.config import settings
+from sirene_pipeline.utils.data_helpers import parquet_glob
+
+
+def get_duck_conn(database: str = ":memory:") -> duckdb.DuckDBPyConnection:
+    """Opens a DuckDB connection configured for the pipeline workloads.
+
+    Every job and check goes through this helper so they share the same
+    session settings:
+
+    - one thread per core;
+    - Parquet footers and row-group metadata cached between reads of a file;
+    - no insertion-order guarantee, so parallel scans and writes can emit rows
+      as soon as they are ready (every ordered output uses an explicit ORDER BY);
+    - the optional memory budget from settings (e.g. "8GB").
+
+    Args:
+        database: Database file to open, in memory by default.
+
+    Returns:
+        The configured connection.
+    """
+    con = duckdb.connect(database=database)
+    con.execute(f"PRAGMA threads={os.cpu_count() or 1}")
+    con.execute("SET enable_object_cache = true")
+    con.execute("SET preserve_insertion_order = false")
+    if settings.duckdb.memory_limit:
+        con.execute(f"SET memory_limit = '{settings.duckdb.memory_limit}'")
+    return con
+
+
+def register_parquet_view(con: duckdb.DuckDBPyConnection, path: Path, name: str = "v") -> None:
+    """Exposes a Parquet file or dataset as a view so every check reads the same relation.
+
+    The view is temporary, hence private to the connection (or cursor) that
+    created it, so concurrent workers can each register a file under the same name.
+
+    Args:
+        con: DuckDB connection on which the view is created.
+        path: Path to the Parquet file, or to the directory of a partitioned dataset.
+        name: Name of the view.
+    """
+    source = parquet_glob(path) if path.is_dir() else path.as_posix()
+    con.execute(f"CREATE OR REPLACE TEMP VIEW {name} AS SELECT * FROM read_parquet('{source}')")
@@ -1,17 +1,37 @@
-import os
+import sys
 import time
 from collections.abc import Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar
 
-import psutil
 from loguru import logger
 
+try:
+    import resource
+except ImportError:  # Windows: no getrusage, fall back to psutil
+    resource = None  # type: ignore[assignment]
+    import psutil
+
 # Type definitions for generic functions
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
+def _peak_memory_mb() -> float:
+    """Returns the peak resident memory of the process, in MB.
+
+    getrusage is a single syscall returning an integer, unlike psutil which
+    parses /proc on every call. ru_maxrss is in kB on Linux and in bytes on macOS.
+
+    Returns:
+        The peak resident set size of the current process.
+    """
+    if resource is None:
+        return float(psutil.Process().memory_info().peak_wset) / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
 def monitor_step(func: Callable[P, R]) -> Callable[P, R]:
     """Decorator to monitor execution time and memory usage of a function.
 
@@ -24,22 +44,20 @@ def monitor_step(func: Callable[P, R]) -> Callable[P, R]:
 
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        process = psutil.Process(os.getpid())
-        start_mem: float = process.memory_info().rss / (1024 * 1024)  # MB
-        start_time: float = time.time()
+        start_mem: float = _peak_memory_mb()
+        start_time: float = time.perf_counter()
 
-        logger.info(f"🚀 Starting {func.__name__} | RAM: {start_mem:.2f} MB")
+        logger.info(f"🚀 Starting {func.__name__} | Peak RAM: {start_mem:.2f} MB")
 
         result: R = func(*args, **kwargs)
 
-        end_time: float = time.time()
-        end_mem: float = process.memory_info().rss / (1024 * 1024)
-        duration: float = end_time - start_time
+        duration: float = time.perf_counter() - start_time
+        end_mem: float = _peak_memory_mb()
 
         msg: str = (
             f"✅ Finished {func.__name__} | "
             f"Duration: {duration:.2f}s | "
-            f"RAM Delta: {end_mem - start_mem:.2f} MB"
+            f"Peak RAM Delta: {end_mem - start_mem:.2f} MB"
         )
         logger.info(msg)
         return result
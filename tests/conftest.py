@@ -1,12 +1,44 @@
 """Shared test fixtures for the SIRENE pipeline."""
 
+from collections.abc import Callable
+from pathlib import Path
+
+import duckdb
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 
-@pytest.fixture
+def _test_duck_conn() -> duckdb.DuckDBPyConnection:
+    """Opens an in-memory DuckDB connection sized for test data.
+
+    Returns:
+        A connection the caller is responsible for closing.
+    """
+    con = duckdb.connect(database=":memory:")
+    # Test-only pragmas: tiny tables need no thread pool nor a large memory budget
+    con.execute("PRAGMA threads=1")
+    con.execute("PRAGMA memory_limit='512MB'")
+    return con
+
+
+@pytest.fixture(scope="session")
+def duck_conn_factory() -> Callable[[], duckdb.DuckDBPyConnection]:
+    """Provides the test connection factory to fixtures of any scope.
+
+    Returns:
+        A function opening a new in-memory test connection on each call.
+    """
+    return _test_duck_conn
+
+
+@pytest.fixture(scope="session")
 def sample_etablissement_df() -> pd.DataFrame:
-    """Returns a sample dataframe with mixed valid and invalid data."""
+    """Returns a sample dataframe with mixed valid and invalid data.
+
+    Built once per session: tests must not mutate it (use .copy() instead).
+    """
     return pd.DataFrame(
         {
             "siret": ["12345678901234", "invalid_siret", "99999999999999"],
@@ -16,3 +48,65 @@ def sample_etablissement_df() -> pd.DataFrame:
             "etatAdministratifEtablissement": ["A", "A", "A"],
         }
     )
+
+
+@pytest.fixture(scope="session")
+def bronze_source_parquet(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Writes the Bronze source Parquet file once per session.
+
+    Args:
+        tmp_path_factory: Pytest factory for session-scoped temporary directories.
+
+    Returns:
+        Path to a read-only source file with two establishments.
+    """
+    source_path = tmp_path_factory.mktemp("bronze_src") / "source_data.parquet"
+    pq.write_table(
+        pa.table(
+            {"siret": ["11122233344455", "66677788899900"], "data": ["Company A", "Company B"]}
+        ),
+        source_path,
+        compression=None,
+    )
+    return source_path
+
+
+@pytest.fixture(scope="session")
+def silver_mock_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Writes a mock Silver layer once per session.
+
+    Args:
+        tmp_path_factory: Pytest factory for session-scoped temporary directories.
+
+    Returns:
+        Read-only Silver directory holding both datasets.
+    """
+    silver_dir = tmp_path_factory.mktemp("silver")
+
+    # Arrow tables written uncompressed: no pandas conversion for tiny fixtures
+    etabs = pa.table(
+        {
+            "siret": ["111001", "111002", "222001"],
+            "siren": ["111", "111", "222"],
+            "departement": ["75", "75", "92"],
+            "secteur_activite": ["IT", "IT", "Bakery"],
+        }
+    )
+    uls = pa.table(
+        {
+            "siren": ["111", "222"],
+            "denominationUniteLegale": ["TechCorp", "BreadInc"],
+            "nomUniteLegale": pa.nulls(2, pa.string()),
+            "prenom1UniteLegale": pa.nulls(2, pa.string()),
+            "categorieEntreprise": ["PME", "GE"],
+            "categorieJuridiqueUniteLegale": ["5710", "5499"],
+            "economieSocialeSolidaireUniteLegale": ["N", "N"],
+        }
+    )
+
+    # Silver datasets are directories of Parquet files
+    for dataset, table in {"etablissements": etabs, "unites_legales": uls}.items():
+        dataset_dir = silver_dir / f"{dataset}_silver"
+        dataset_dir.mkdir()
+        pq.write_table(table, dataset_dir / "part-0.parquet", compression=None)
+    return silver_dir
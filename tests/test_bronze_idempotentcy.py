@@ -1,26 +1,42 @@
 """Unit tests for the Bronze layer idempotency logic."""
 
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
 import duckdb
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 from sirene_pipeline.services.bronze_job import run_ingestion_bronze
 
 
 @pytest.fixture
-def temp_db() -> duckdb.DuckDBPyConnection:
-    """Provides a temporary in-memory DuckDB connection.
+def registry_con(
+    duck_conn_factory: Callable[[], duckdb.DuckDBPyConnection],
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """Provides an empty in-memory Bronze registry.
 
-    Returns:
-        A DuckDB connection object.
+    The registry never touches the disk: no file is created or flushed on commit.
+
+    Args:
+        duck_conn_factory: Opens the shared test connections.
+
+    Yields:
+        A DuckDB connection whose default catalog is the registry.
     """
-    return duckdb.connect(database=":memory:")
+    con = duck_conn_factory()
+    try:
+        yield con
+    finally:
+        con.close()
 
 
-def test_bronze_idempotency(tmp_path: Path, temp_db: duckdb.DuckDBPyConnection) -> None:
+def test_bronze_idempotency(
+    tmp_path: Path, bronze_source_parquet: Path, registry_con: duckdb.DuckDBPyConnection
+) -> None:
     """Checks if multiple ingestions of the same data result in no duplicates.
 
     This test ensures that running the ingestion twice with the same source
@@ -28,31 +44,25 @@ def test_bronze_idempotency(tmp_path: Path, temp_db: duckdb.DuckDBPyConnection)
 
     Args:
         tmp_path: Pytest fixture for temporary file management.
-        temp_db: Pytest fixture for DuckDB connection.
+        bronze_source_parquet: Fake source Parquet file with two rows.
+        registry_con: In-memory Bronze registry, shared by both ingestions.
     """
     # 1. Setup temporary paths
-    fake_parquet_source: Path = tmp_path / "source_data.parquet"
-    registry_db: Path = tmp_path / "bronze_metadata.db"
+    fake_parquet_source: Path = bronze_source_parquet
     output_parquet: Path = tmp_path / "bronze_output.parquet"
     dataset_name: str = "etablissements_test"
+    con: duckdb.DuckDBPyConnection = registry_con
 
-    # 2. Create a fake source Parquet file
-    source_df: pd.DataFrame = pd.DataFrame(
-        {"siret": ["11122233344455", "66677788899900"], "data": ["Company A", "Company B"]}
-    )
-    source_df.to_parquet(fake_parquet_source)
-
-    # 3. First ingestion
+    # 2. First ingestion
     run_ingestion_bronze(
         url=str(fake_parquet_source),
         output_path=output_parquet,
         dataset_name=dataset_name,
         limit=0,
-        registry_path=str(registry_db),
+        con=con,
     )
 
-    # 4. Verification of first run
-    con: duckdb.DuckDBPyConnection = duckdb.connect(database=str(registry_db))
+    # 3. Verification of first run
     res_tuple: tuple[Any, ...] | None = con.execute(
         f"SELECT COUNT(*) FROM {dataset_name}"
     ).fetchone()
@@ -60,19 +70,17 @@ def test_bronze_idempotency(tmp_path: Path, temp_db: duckdb.DuckDBPyConnection)
     assert res_tuple is not None, "First run registry check failed to return results."
     res: Any = res_tuple[0]
     assert res == 2, "First run should ingest exactly 2 rows."
-    con.close()
 
-    # 5. Second run (Idempotence test)
+    # 4. Second run (Idempotence test)
     run_ingestion_bronze(
         url=str(fake_parquet_source),
         output_path=output_parquet,
         dataset_name=dataset_name,
         limit=0,
-        registry_path=str(registry_db),
+        con=con,
     )
 
-    # 6. Final Verification
-    con = duckdb.connect(database=str(registry_db))
+    # 5. Final Verification
     res_after_tuple: tuple[Any, ...] | None = con.execute(
         f"SELECT COUNT(*) FROM {dataset_name}"
     ).fetchone()
@@ -80,4 +88,111 @@ def test_bronze_idempotency(tmp_path: Path, temp_db: duckdb.DuckDBPyConnection)
     assert res_after_tuple is not None, "Second run registry check failed."
     res_after: Any = res_after_tuple[0]
     assert res_after == 2, "Second run should not add duplicates."
-    con.close()
+
+    stats_tuple: tuple[Any, ...] | None = con.execute(
+        "SELECT row_count FROM _bronze_stats WHERE table_name = ?", [dataset_name]
+    ).fetchone()
+
+    assert stats_tuple is not None, "Registry stats were not recorded."
+    assert stats_tuple[0] == 2, "Registry stats should match the table total."
+
+
+def test_bronze_projection_and_limit(
+    tmp_path: Path, registry_con: duckdb.DuckDBPyConnection
+) -> None:
+    """Checks that only the requested columns and the first rows are ingested.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+        registry_con: In-memory Bronze registry.
+    """
+    fake_parquet_source: Path = tmp_path / "source_data.parquet"
+    output_parquet: Path = tmp_path / "bronze_output.parquet"
+    dataset_name: str = "etablissements_test"
+
+    source: pa.Table = pa.table(
+        {
+            "siret": ["11122233344455", "66677788899900", "12312312312312"],
+            "data": ["Company A", "Company B", "Company C"],
+            "unused": ["x", "y", "z"],
+        }
+    )
+    pq.write_table(source, fake_parquet_source, compression=None)
+
+    run_ingestion_bronze(
+        url=str(fake_parquet_source),
+        output_path=output_parquet,
+        dataset_name=dataset_name,
+        limit=2,
+        columns=["data", "ingested_at"],
+        con=registry_con,
+    )
+
+    bronze_df: pd.DataFrame = pd.read_parquet(output_parquet)
+
+    assert list(bronze_df.columns) == ["siret", "data", "ingested_at"]
+    assert len(bronze_df) == 2, "Only the first 2 source rows should be ingested."
+
+
+def test_bronze_adds_newly_selected_columns(
+    tmp_path: Path, bronze_source_parquet: Path, registry_con: duckdb.DuckDBPyConnection
+) -> None:
+    """Checks that a column selected after the registry was created is added to it.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+        bronze_source_parquet: Fake source Parquet file with two rows.
+        registry_con: In-memory Bronze registry, shared by both ingestions.
+    """
+    output_parquet: Path = tmp_path / "bronze_output.parquet"
+    dataset_name: str = "etablissements_test"
+
+    # First ingestion: only the primary key is selected
+    run_ingestion_bronze(
+        url=str(bronze_source_parquet),
+        output_path=output_parquet,
+        dataset_name=dataset_name,
+        limit=0,
+        columns=["siret"],
+        con=registry_con,
+    )
+
+    # Second ingestion: 'data' is now selected, new rows fill it
+    new_source: Path = tmp_path / "new_source.parquet"
+    pq.write_table(
+        pa.table({"siret": ["12312312312312"], "data": ["Company C"]}),
+        new_source,
+        compression=None,
+    )
+    run_ingestion_bronze(
+        url=str(new_source),
+        output_path=output_parquet,
+        dataset_name=dataset_name,
+        limit=0,
+        columns=["data"],
+        con=registry_con,
+    )
+
+    rows: list[tuple[Any, ...]] = registry_con.execute(
+        f"SELECT siret, data FROM {dataset_name} ORDER BY siret"
+    ).fetchall()
+    assert rows == [
+        ("11122233344455", None),
+        ("12312312312312", "Company C"),
+        ("66677788899900", None),
+    ]
+
+
+def test_bronze_rejects_invalid_identifiers(tmp_path: Path) -> None:
+    """Checks that names interpolated in SQL must be plain identifiers.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+    """
+    with pytest.raises(ValueError):
+        run_ingestion_bronze(
+            url=str(tmp_path / "source_data.parquet"),
+            output_path=tmp_path / "bronze_output.parquet",
+            dataset_name="etablissements; DROP TABLE x",
+            registry_path=str(tmp_path / "bronze_metadata.db"),
+        )
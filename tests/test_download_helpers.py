@@ -0,0 +1,142 @@
+"""Unit tests for the staging of remote source files against a local HTTP server."""
+
+import threading
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from sirene_pipeline.utils.download_helpers import stage_remote_file
+
+PAYLOAD = bytes(range(256)) * 4
+
+
+@dataclass
+class _RemoteFile:
+    """State of the file served by the test server."""
+
+    url: str
+    etag: str = '"v1"'
+    # When False, Accept-Ranges is advertised but every GET returns the whole file
+    honour_range: bool = True
+    # When True, every range answer only carries the first half of its bytes
+    truncate_ranges: bool = False
+    # Range header of every GET received ("" for a plain GET)
+    gets: list[str] = field(default_factory=list)
+
+
+@pytest.fixture
+def remote_file() -> Iterator[_RemoteFile]:
+    """Serves PAYLOAD over HTTP on a free local port.
+
+    Yields:
+        The served file state; tests may change its ETag or Range behaviour.
+    """
+    state = _RemoteFile(url="")
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send_headers(self, status: int, length: int, extra: dict[str, str]) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", str(length))
+            self.send_header("ETag", state.etag)
+            self.send_header("Accept-Ranges", "bytes")
+            for key, value in extra.items():
+                self.send_header(key, value)
+            self.end_headers()
+
+        def do_HEAD(self) -> None:  # noqa: N802 (http.server naming)
+            self._send_headers(200, len(PAYLOAD), {})
+
+        def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+            byte_range = self.headers.get("Range", "")
+            state.gets.append(byte_range)
+            if byte_range and state.honour_range:
+                start, end = (int(bound) for bound in byte_range.removeprefix("bytes=").split("-"))
+                body = PAYLOAD[start : end + 1]
+                if state.truncate_ranges:
+                    body = body[: len(body) // 2]
+                content_range = f"bytes {start}-{end}/{len(PAYLOAD)}"
+                self._send_headers(206, len(body), {"Content-Range": content_range})
+                self.wfile.write(body)
+            else:
+                self._send_headers(200, len(PAYLOAD), {})
+                self.wfile.write(PAYLOAD)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    state.url = f"http://127.0.0.1:{server.server_address[1]}/StockEtablissement.parquet"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_stage_with_range_requests(tmp_path: Path, remote_file: _RemoteFile) -> None:
+    """Checks that a file larger than one chunk is rebuilt from its byte ranges.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+        remote_file: Local HTTP server honouring Range requests.
+    """
+    staged: Path = stage_remote_file(remote_file.url, tmp_path, max_workers=4, chunk_size=100)
+
+    assert staged.read_bytes() == PAYLOAD
+    assert len(remote_file.gets) == 11
+    assert all(byte_range.startswith("bytes=") for byte_range in remote_file.gets)
+
+
+def test_stage_fails_when_range_is_ignored(tmp_path: Path, remote_file: _RemoteFile) -> None:
+    """Checks that a server answering ranges with the whole file aborts the staging.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+        remote_file: Local HTTP server advertising but ignoring Range requests.
+    """
+    remote_file.honour_range = False
+
+    with pytest.raises(OSError, match="Range request ignored"):
+        stage_remote_file(remote_file.url, tmp_path, max_workers=4, chunk_size=100)
+
+    assert not (tmp_path / "StockEtablissement.parquet.raw").exists()
+
+
+def test_stage_fails_on_truncated_range(tmp_path: Path, remote_file: _RemoteFile) -> None:
+    """Checks that a range answered with a short body aborts the staging.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+        remote_file: Local HTTP server sending half of each range.
+    """
+    remote_file.truncate_ranges = True
+
+    with pytest.raises(OSError, match="Truncated range"):
+        stage_remote_file(remote_file.url, tmp_path, max_workers=4, chunk_size=100)
+
+    assert not (tmp_path / "StockEtablissement.parquet.raw").exists()
+    assert not (tmp_path / "StockEtablissement.parquet.raw.version").exists()
+
+
+def test_stage_reuses_unchanged_copy(tmp_path: Path, remote_file: _RemoteFile) -> None:
+    """Checks that the staged copy is reused until the remote ETag changes.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+        remote_file: Local HTTP server whose ETag is bumped between runs.
+    """
+    stage_remote_file(remote_file.url, tmp_path)
+    assert remote_file.gets == [""]
+
+    stage_remote_file(remote_file.url, tmp_path)
+    assert remote_file.gets == [""], "An unchanged file must not be downloaded again."
+
+    remote_file.etag = '"v2"'
+    staged: Path = stage_remote_file(remote_file.url, tmp_path)
+    assert remote_file.gets == ["", ""]
+    assert staged.with_name(f"{staged.name}.version").read_text() == '"v2"'
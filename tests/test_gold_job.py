@@ -1,87 +1,238 @@
 """Unit tests for the Gold layer logic (Enrichment and KPIs)."""
 
+from collections.abc import Callable, Iterator
+from dataclasses import replace
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import duckdb
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pandas.testing import assert_frame_equal
 
 from sirene_pipeline.config import settings
+from sirene_pipeline.services import gold_job
 from sirene_pipeline.services.gold_job import run_gold_layer
 
 
-def test_gold_logic_and_kpis(tmp_path: Path) -> None:
-    """Verifies that the Master table is correctly joined and KPIs are accurate.
+@pytest.fixture(scope="module")
+def gold_output(
+    tmp_path_factory: pytest.TempPathFactory,
+    silver_mock_dir: Path,
+    duck_conn_factory: Callable[[], duckdb.DuckDBPyConnection],
+) -> Iterator[tuple[Path, duckdb.DuckDBPyConnection]]:
+    """Runs the Gold layer once on mock Silver data for every test of the module.
 
     Args:
-        tmp_path: Pytest fixture providing a temporary directory for test files.
+        tmp_path_factory: Pytest factory for temporary directories shared by the module.
+        silver_mock_dir: Read-only mock Silver layer.
+        duck_conn_factory: Opens the shared test connections.
+
+    Yields:
+        The Gold output directory and a DuckDB connection to query it.
     """
-    # 1. Setup paths
-    silver_dir: Path = tmp_path / "silver"
-    gold_dir: Path = tmp_path / "gold"
-    silver_dir.mkdir()
-    gold_dir.mkdir()
+    gold_dir: Path = tmp_path_factory.mktemp("gold")
+
+    # Gold only reads Silver: the session mock is used in place
+    run_gold_layer(custom_silver_dir=silver_mock_dir, custom_gold_dir=gold_dir)
+
+    # Each Gold output is decoded once into Arrow and registered under a view name:
+    # the tests query the in-memory buffers instead of the Parquet files.
+    con: duckdb.DuckDBPyConnection = duck_conn_factory()
+    for kpi_attr in ("dept_dist", "sectors", "size_dist"):
+        con.register(kpi_attr, pq.read_table(gold_dir / getattr(settings.gold.kpis, kpi_attr)))
+    try:
+        yield gold_dir, con
+    finally:
+        con.close()
+
+
+def test_master_exists(gold_output: tuple[Path, duckdb.DuckDBPyConnection]) -> None:
+    """Checks that the enriched Master table is exported.
 
-    # 2. Create mock Silver data
-    etabs_df: pd.DataFrame = pd.DataFrame(
+    Args:
+        gold_output: Gold output directory and query connection.
+    """
+    gold_dir, _ = gold_output
+    master_path: Path = gold_dir / settings.gold.master_filename
+    assert master_path.exists()
+
+
+@pytest.mark.parametrize(
+    ("kpi_attr", "expected"),
+    [
+        ("dept_dist", {"departement": ["75", "92"], "total_establishments": [2, 1]}),
+        (
+            "sectors",
+            {"departement": ["75", "92"], "secteur_activite": ["IT", "Bakery"], "count": [2, 1]},
+        ),
+        ("size_dist", {"categorieEntreprise": ["GE", "PME"], "total": [1, 2]}),
+    ],
+)
+def test_kpi_values(
+    gold_output: tuple[Path, duckdb.DuckDBPyConnection],
+    kpi_attr: str,
+    expected: dict[str, list[Any]],
+) -> None:
+    """Compares a whole KPI output with its expected frame on the shared Gold run.
+
+    Args:
+        gold_output: Gold output directory and query connection.
+        kpi_attr: KPI key in settings.gold.kpis, also the registered table name.
+        expected: Expected KPI rows, ordered by their group column.
+    """
+    gold_dir, con = gold_output
+    kpi_path: Path = gold_dir / getattr(settings.gold.kpis, kpi_attr)
+    assert kpi_path.exists(), f"Missing KPI file: {kpi_path}"
+
+    group_col: str = next(iter(expected))
+    result: pd.DataFrame = con.table(kpi_attr).df().sort_values(group_col, ignore_index=True)
+
+    # Column-wise vectorized comparison, whatever the number of KPI rows
+    assert_frame_equal(result, pd.DataFrame(expected), check_dtype=False, check_like=True)
+
+
+def _write_silver(
+    silver_dir: Path, part: str, etabs: dict[str, list[Any]], uls: dict[str, list[Any]]
+) -> None:
+    """Appends one Silver part file per dataset, ingested on day `part` of January 2026.
+
+    Args:
+        silver_dir: Silver layer root.
+        part: Part number, also the ingestion day.
+        etabs: Establishment columns.
+        uls: Legal Unit columns; the other Legal Unit columns get fixed values.
+    """
+    ingested_at = datetime(2026, 1, int(part))
+    etab_rows, ul_rows = len(etabs["siret"]), len(uls["siren"])
+    etabs_tbl = pa.table({**etabs, "ingested_at": [ingested_at] * etab_rows})
+    ul_tbl = pa.table(
         {
-            "siret": ["111001", "111002", "222001"],
-            "siren": ["111", "111", "222"],
-            "departement": ["75", "75", "92"],
-            "secteur_activite": ["IT", "IT", "Bakery"],
+            **uls,
+            "categorieEntreprise": ["PME"] * ul_rows,
+            "nomUniteLegale": pa.nulls(ul_rows, pa.string()),
+            "prenom1UniteLegale": pa.nulls(ul_rows, pa.string()),
+            "categorieJuridiqueUniteLegale": ["5710"] * ul_rows,
+            "economieSocialeSolidaireUniteLegale": ["N"] * ul_rows,
+            "ingested_at": [ingested_at] * ul_rows,
         }
     )
+    etab_dir: Path = silver_dir / "etablissements_silver"
+    ul_dir: Path = silver_dir / "unites_legales_silver"
+    etab_dir.mkdir(parents=True, exist_ok=True)
+    ul_dir.mkdir(parents=True, exist_ok=True)
+    pq.write_table(etabs_tbl, etab_dir / f"part-{part}.parquet", compression=None)
+    pq.write_table(ul_tbl, ul_dir / f"part-{part}.parquet", compression=None)
 
-    ul_df: pd.DataFrame = pd.DataFrame(
+
+def _write_two_runs(silver_dir: Path, gold_dir: Path) -> None:
+    """Runs Gold on a first Silver part, then appends the second part.
+
+    The first part has an establishment (333001) without its Legal Unit; the second
+    part adds a new establishment in 75 and the missing Legal Unit.
+
+    Args:
+        silver_dir: Silver layer root.
+        gold_dir: Gold output directory.
+    """
+    _write_silver(
+        silver_dir,
+        "1",
         {
-            "siren": ["111", "222"],
-            "denominationUniteLegale": ["TechCorp", "BreadInc"],
-            "nomUniteLegale": [None, None],
-            "prenom1UniteLegale": [None, None],
-            "categorieEntreprise": ["PME", "GE"],
-            "categorieJuridiqueUniteLegale": ["5710", "5499"],
-            "economieSocialeSolidaireUniteLegale": ["N", "N"],
-        }
+            "siret": ["111001", "333001"],
+            "siren": ["111", "333"],
+            "departement": ["75", "93"],
+            "secteur_activite": ["IT", "IT"],
+        },
+        {"siren": ["111"], "denominationUniteLegale": ["TechCorp"]},
     )
+    run_gold_layer(custom_silver_dir=silver_dir, custom_gold_dir=gold_dir)
 
-    etabs_df.to_parquet(silver_dir / "etablissements_silver.parquet")
-    ul_df.to_parquet(silver_dir / "unites_legales_silver.parquet")
+    _write_silver(
+        silver_dir,
+        "2",
+        {
+            "siret": ["111002"],
+            "siren": ["111"],
+            "departement": ["75"],
+            "secteur_activite": ["IT"],
+        },
+        {"siren": ["333"], "denominationUniteLegale": ["LateCorp"]},
+    )
 
-    # 3. Run the Gold Layer
-    run_gold_layer(custom_silver_dir=silver_dir, custom_gold_dir=gold_dir)
 
-    # 4. VERIFICATIONS
+def _assert_two_runs_folded(gold_dir: Path) -> None:
+    """Checks the Gold outputs once both Silver parts are folded in.
+
+    Args:
+        gold_dir: Gold output directory.
+    """
     con: duckdb.DuckDBPyConnection = duckdb.connect()
+    master: pd.DataFrame = con.execute(
+        "SELECT siret, denominationUniteLegale FROM read_parquet(?) ORDER BY siret",
+        [(gold_dir / settings.gold.master_filename).as_posix()],
+    ).df()
+    dept: dict[str, int] = dict(
+        con.execute(
+            "SELECT departement, total_establishments FROM read_parquet(?)",
+            [(gold_dir / settings.gold.kpis.dept_dist).as_posix()],
+        ).fetchall()
+    )
+    size: dict[str, int] = dict(
+        con.execute(
+            "SELECT categorieEntreprise, total FROM read_parquet(?)",
+            [(gold_dir / settings.gold.kpis.size_dist).as_posix()],
+        ).fetchall()
+    )
+    con.close()
 
-    # Check A: Master Table
-    master_path: Path = gold_dir / settings.gold.master_filename
-    assert master_path.exists()
+    assert master["siret"].tolist() == ["111001", "111002", "333001"]
+    assert master["denominationUniteLegale"].tolist() == ["TechCorp", "TechCorp", "LateCorp"]
+    assert dept == {"75": 2, "93": 1}
+    assert size == {"PME": 3}
+
+
+def test_gold_incremental_refresh(tmp_path: Path) -> None:
+    """Verifies that a second run only folds in the rows appended to Silver.
+
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory for test files.
+    """
+    silver_dir: Path = tmp_path / "silver"
+    gold_dir: Path = tmp_path / "gold"
 
-    # Check B: KPI 1 (Departments)
-    kpi_dept_path: Path = gold_dir / settings.gold.kpis.dept_dist
-    assert kpi_dept_path.exists(), f"Missing KPI file: {kpi_dept_path}"
+    _write_two_runs(silver_dir, gold_dir)
+    run_gold_layer(custom_silver_dir=silver_dir, custom_gold_dir=gold_dir)
 
-    # Fetch and check result for Dept 75
-    res_dept: tuple[Any, ...] | None = con.execute(f"""
-        SELECT total_establishments 
-        FROM read_parquet('{kpi_dept_path.as_posix()}') 
-        WHERE departement='75'
-    """).fetchone()
+    _assert_two_runs_folded(gold_dir)
 
-    assert res_dept is not None, "KPI 1 query returned no results"
-    assert res_dept[0] == 2
 
-    # Check C: KPI 3 (Company Size)
-    kpi_size_path: Path = gold_dir / settings.gold.kpis.size_dist
-    assert kpi_size_path.exists()
+def test_gold_failed_kpi_step_is_retried(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verifies that a failing KPI step rolls back the master and the watermark.
 
-    res_size: tuple[Any, ...] | None = con.execute(f"""
-        SELECT total 
-        FROM read_parquet('{kpi_size_path.as_posix()}') 
-        WHERE categorieEntreprise='PME'
-    """).fetchone()
+    The rerun must then see the same Silver rows as new and fix every Gold table.
 
-    assert res_size is not None, "KPI 3 query returned no results"
-    assert res_size[0] == 2
+    Args:
+        tmp_path: Pytest fixture providing a temporary directory for test files.
+        monkeypatch: Pytest fixture used to break one KPI query for one run.
+    """
+    silver_dir: Path = tmp_path / "silver"
+    gold_dir: Path = tmp_path / "gold"
 
-    con.close()
+    _write_two_runs(silver_dir, gold_dir)
+    with monkeypatch.context() as patch:
+        broken = replace(gold_job.KPIS["size_dist"], query="SELECT nope FROM gold.master")
+        patch.setitem(gold_job.KPIS, "size_dist", broken)
+        with pytest.raises(duckdb.Error):
+            run_gold_layer(custom_silver_dir=silver_dir, custom_gold_dir=gold_dir)
+
+    # The exports of the failed run are not written either
+    master: pa.Table = pq.read_table(gold_dir / settings.gold.master_filename)
+    assert sorted(master.column("siret").to_pylist()) == ["111001", "333001"]
+
+    run_gold_layer(custom_silver_dir=silver_dir, custom_gold_dir=gold_dir)
+
+    _assert_two_runs_folded(gold_dir)
@@ -0,0 +1,236 @@
+"""Unit tests for the Silver layer job (storage and incremental runs)."""
+
+from collections.abc import Callable, Iterator
+from datetime import date, datetime
+from pathlib import Path
+
+import duckdb
+import pandas as pd
+import pytest
+
+from sirene_pipeline.config import settings
+from sirene_pipeline.services.silver_job import _recover_silver, run_silver_transformation
+from sirene_pipeline.utils.data_helpers import parquet_glob
+
+BRONZE_ETABLISSEMENTS = """
+    CREATE TABLE bronze.etablissements (
+        siret VARCHAR,
+        siren VARCHAR,
+        etatAdministratifEtablissement VARCHAR,
+        dateCreationEtablissement DATE,
+        codePostalEtablissement VARCHAR,
+        libelleCommuneEtablissement VARCHAR,
+        activitePrincipaleEtablissement VARCHAR,
+        trancheEffectifsEtablissement VARCHAR,
+        etablissementSiege BOOLEAN,
+        enseigne1Etablissement VARCHAR,
+        ingested_at VARCHAR
+    )
+"""
+
+
+@pytest.fixture
+def silver_env(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    duck_conn_factory: Callable[[], duckdb.DuckDBPyConnection],
+) -> Iterator[tuple[duckdb.DuckDBPyConnection, Path]]:
+    """Provides an empty in-memory Bronze registry and a temporary Silver directory.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+        monkeypatch: Pytest fixture redirecting the Silver output for one test.
+        duck_conn_factory: Opens the shared test connections.
+
+    Yields:
+        A connection with the registry attached as 'bronze', and the Silver
+        dataset directory of the establishments.
+    """
+    monkeypatch.setitem(settings.silver, "output_dir", str(tmp_path / "silver"))
+    con = duck_conn_factory()
+    con.execute("ATTACH ':memory:' AS bronze")
+    con.execute(BRONZE_ETABLISSEMENTS)
+    try:
+        yield con, tmp_path / "silver" / "etablissements_silver"
+    finally:
+        con.close()
+
+
+def _read_silver(silver_output: Path) -> pd.DataFrame:
+    """Reads a Silver dataset, ordered by SIRET.
+
+    Args:
+        silver_output: Directory of the partitioned Silver dataset.
+
+    Returns:
+        Every Silver row, without the partition column.
+    """
+    return (
+        duckdb.sql(
+            f"SELECT * EXCLUDE (ingested_date) FROM read_parquet('{parquet_glob(silver_output)}')"
+        )
+        .df()
+        .sort_values("siret", ignore_index=True)
+    )
+
+
+def test_silver_cleaning_and_features(silver_env: tuple[duckdb.DuckDBPyConnection, Path]) -> None:
+    """Checks the fill rules, the dropped rows and the engineered features.
+
+    Args:
+        silver_env: Bronze registry connection and Silver dataset directory.
+    """
+    con, silver_output = silver_env
+    con.execute("""
+        INSERT INTO bronze.etablissements VALUES
+        ('12345678900011', '123456789', NULL, DATE '2000-06-01', '75001 ', 'PARIS',
+            '62.01Z', NULL, true, NULL, '2026-01-01 10:00:00'),
+        ('12345678900029', '123456789', 'F', NULL, '92100', NULL,
+            NULL, '11', false, 'SHOP', '2026-01-01 10:00:00'),
+        -- Malformed postal code, missing SIRET, outside Ile-de-France: dropped
+        ('12345678900037', '123456789', 'A', NULL, '75AB1', 'PARIS',
+            NULL, NULL, false, NULL, '2026-01-01 10:00:00'),
+        (NULL, '123456789', 'A', NULL, '75002', 'PARIS',
+            NULL, NULL, false, NULL, '2026-01-01 10:00:00'),
+        ('12345678900045', '123456789', 'A', NULL, '69001', 'LYON',
+            NULL, NULL, false, NULL, '2026-01-01 10:00:00')
+    """)
+
+    run_silver_transformation("etablissements", con=con)
+
+    silver: pd.DataFrame = _read_silver(silver_output)
+    assert silver["siret"].tolist() == ["12345678900011", "12345678900029"]
+    # Fill rules, then the default for any other missing text
+    assert silver["etatAdministratifEtablissement"].tolist() == ["A", "F"]
+    assert silver["trancheEffectifsEtablissement"].tolist() == ["00", "11"]
+    assert silver["enseigne1Etablissement"].tolist() == ["Non renseigné", "SHOP"]
+    assert silver["libelleCommuneEtablissement"].tolist() == ["PARIS", "Indéterminé"]
+    assert silver["codePostalEtablissement"].tolist() == ["75001", "92100"]
+    # Features
+    assert silver["departement"].tolist() == ["75", "92"]
+    assert silver["secteur_activite"].tolist() == ["62", "Indéterminé"]
+    assert silver["age_entreprise"].tolist() == [float(date.today().year - 2000), -1.0]
+
+
+def test_silver_text_creation_dates(silver_env: tuple[duckdb.DuckDBPyConnection, Path]) -> None:
+    """Checks that creation dates stored as text are parsed, bad ones giving an age of -1.
+
+    Args:
+        silver_env: Bronze registry connection and Silver dataset directory.
+    """
+    con, silver_output = silver_env
+    con.execute("DROP TABLE bronze.etablissements")
+    con.execute(
+        BRONZE_ETABLISSEMENTS.replace(
+            "dateCreationEtablissement DATE", "dateCreationEtablissement VARCHAR"
+        )
+    )
+    con.execute("""
+        INSERT INTO bronze.etablissements VALUES
+        ('12345678900011', '123456789', 'A', '2000-06-01', '75001', 'PARIS',
+            '62.01Z', '00', true, NULL, '2026-01-01 10:00:00'),
+        ('12345678900029', '123456789', 'A', 'not a date', '75001', 'PARIS',
+            '62.01Z', '00', true, NULL, '2026-01-01 10:00:00')
+    """)
+
+    run_silver_transformation("etablissements", con=con)
+
+    silver: pd.DataFrame = _read_silver(silver_output)
+    assert silver["dateCreationEtablissement"].iloc[0] == datetime(2000, 6, 1)
+    assert pd.isna(silver["dateCreationEtablissement"].iloc[1])
+    assert silver["age_entreprise"].tolist() == [float(date.today().year - 2000), -1.0]
+
+
+def test_silver_second_run_appends_new_ids(
+    silver_env: tuple[duckdb.DuckDBPyConnection, Path],
+) -> None:
+    """Checks that a second run only appends the entities not yet in Silver.
+
+    Args:
+        silver_env: Bronze registry connection and Silver dataset directory.
+    """
+    con, silver_output = silver_env
+    con.execute("""
+        INSERT INTO bronze.etablissements VALUES
+        ('12345678900011', '123456789', 'A', NULL, '75001', 'PARIS',
+            '62.01Z', '00', true, NULL, '2026-01-01 10:00:00')
+    """)
+    run_silver_transformation("etablissements", con=con)
+
+    # A new version of the known establishment, and a new one
+    con.execute("""
+        INSERT INTO bronze.etablissements VALUES
+        ('12345678900011', '123456789', 'F', NULL, '75001', 'PARIS',
+            '62.01Z', '00', true, NULL, '2026-01-02 10:00:00'),
+        ('12345678900029', '123456789', 'A', NULL, '93100', 'MONTREUIL',
+            '47.11A', '00', false, NULL, '2026-01-02 10:00:00')
+    """)
+    run_silver_transformation("etablissements", con=con)
+
+    silver: pd.DataFrame = _read_silver(silver_output)
+    assert silver["siret"].tolist() == ["12345678900011", "12345678900029"]
+    assert silver["etatAdministratifEtablissement"].tolist() == ["A", "A"]
+    assert silver["ingested_at"].tolist() == [
+        datetime(2026, 1, 1, 10),
+        datetime(2026, 1, 2, 10),
+    ]
+
+
+def test_silver_compaction(
+    silver_env: tuple[duckdb.DuckDBPyConnection, Path], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Checks that small appended files are compacted into one file per partition.
+
+    Args:
+        silver_env: Bronze registry connection and Silver dataset directory.
+        monkeypatch: Pytest fixture lowering the compaction threshold for one test.
+    """
+    con, silver_output = silver_env
+    monkeypatch.setitem(settings.silver, "compaction_file_threshold", 1)
+
+    # Two runs on the same day append two files to the same partition
+    for siret, ingested_at in [
+        ("12345678900011", "2026-01-01 10:00:00"),
+        ("12345678900029", "2026-01-01 12:00:00"),
+    ]:
+        con.execute(
+            "INSERT INTO bronze.etablissements VALUES"
+            " (?, '123456789', 'A', NULL, '75001', 'PARIS', '62.01Z', '00', true, NULL, ?)",
+            [siret, ingested_at],
+        )
+        run_silver_transformation("etablissements", con=con)
+
+    files: list[Path] = list(silver_output.rglob("*.parquet"))
+    assert [file.parent.name for file in files] == ["ingested_date=2026-01-01"]
+    assert _read_silver(silver_output)["siret"].tolist() == ["12345678900011", "12345678900029"]
+    assert sorted(path.name for path in silver_output.parent.iterdir()) == ["etablissements_silver"]
+
+
+@pytest.mark.parametrize("swapped", [False, True])
+def test_recover_interrupted_compaction(tmp_path: Path, swapped: bool) -> None:
+    """Checks that a compaction interrupted between or after its renames is recovered.
+
+    Args:
+        tmp_path: Pytest fixture for temporary file management.
+        swapped: Whether the compacted dataset was already swapped in.
+    """
+    silver_output: Path = tmp_path / "etablissements_silver"
+    previous: Path = tmp_path / "etablissements_silver.previous"
+    compacted: Path = tmp_path / "etablissements_silver.compacted"
+    (previous / "ingested_date=2026-01-01").mkdir(parents=True)
+    (previous / "ingested_date=2026-01-01" / "data_0.parquet").write_bytes(b"previous")
+    compacted.mkdir()
+    if swapped:
+        silver_output.mkdir()
+        (silver_output / "data_0.parquet").write_bytes(b"compacted")
+
+    _recover_silver(silver_output)
+
+    assert not previous.exists()
+    assert not compacted.exists()
+    expected: Path = (
+        silver_output / "data_0.parquet"
+        if swapped
+        else silver_output / "ingested_date=2026-01-01" / "data_0.parquet"
+    )
+    assert expected.read_bytes() == (b"compacted" if swapped else b"previous")